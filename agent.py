@@ -1,12 +1,20 @@
 import os
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
+from utils.response_cache import get_cached_response, cache_response
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client with bounded timeouts and a couple of retries
+client = OpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    max_retries=2
+)
+
+SYSTEM_PROMPT = "You are a helpful AI assistant."
 
 
 def chat_with_agent(prompt: str, model: str = "gpt-4o-mini") -> str:
@@ -20,15 +28,21 @@ def chat_with_agent(prompt: str, model: str = "gpt-4o-mini") -> str:
     Returns:
         The AI's response text
     """
+    cached_content = get_cached_response(model, SYSTEM_PROMPT, prompt)
+    if cached_content is not None:
+        return cached_content
+
     try:
         response = client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": "You are a helpful AI assistant."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
         )
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        cache_response(model, SYSTEM_PROMPT, prompt, content)
+        return content
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -1,15 +1,48 @@
 import os
+import re
 import json
-from openai import OpenAI
+import asyncio
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 import chainlit as cl
-from tools.tool_registry import TOOLS, execute_function
+from chainlit.logger import logger
+from tools.tool_registry import TOOLS, execute_function_json
+from tools.prefetch import guess_tool_calls
+from utils.response_cache import get_cached_response, cache_response
+from utils.semantic_cache import SemanticCache
+from utils.embedding_batcher import EmbeddingBatcher
+from utils.router import DIRECT_TOOL, ROUTE_MODELS, MINI, route, format_direct_answer
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize async OpenAI client so API calls don't block the Chainlit event loop.
+# One pooled HTTP client is shared by every session, so connections stay warm,
+# and bounded timeouts with a couple of retries keep a network blip from
+# stalling a reply.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=http_client,
+    max_retries=2
+)
+
+MODEL = ROUTE_MODELS[MINI]
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Shared across sessions: answers near-duplicate first-turn questions, with
+# concurrent sessions' embedding requests batched into single API calls
+semantic_cache = SemanticCache()
+embedding_batcher = EmbeddingBatcher(client, EMBEDDING_MODEL)
+
+# Messages that differ only in their numbers ("I'm 30, 80kg" vs "I'm 25, 60kg")
+# embed almost identically, but their answers don't transfer between users, so
+# they never use the semantic cache
+_HAS_DIGIT = re.compile(r"\d")
 
 # Enhanced system prompt for health & fitness
 SYSTEM_PROMPT = """You are Elicia, an expert health and fitness AI coach with deep knowledge in:
@@ -40,12 +73,198 @@ You have access to specialized tools for:
 Be friendly, encouraging, and knowledgeable. Help users achieve their health and fitness goals!
 """
 
+# OpenAI caches prompt prefixes (tools + leading messages) of 1024+ tokens, so every
+# request must start with the same tool schema and this exact system message.
+# Never put per-session or per-turn state (names, dates, etc.) into it; add that
+# as a separate message after it instead.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+# Conversation memory: keep this many recent turns verbatim and fold older
+# turns into a single summary message placed right after SYSTEM_MESSAGE.
+# Summarizing waits until SUMMARY_BATCH_TURNS extra turns have accumulated so
+# the extra API call isn't made on every message.
+MAX_RECENT_TURNS = 6
+SUMMARY_BATCH_TURNS = 3
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+SUMMARY_MAX_TOKENS = 200
+SUMMARY_PROMPT = """Summarize this conversation between a user and Elicia, a health and fitness coach.
+Keep every fact needed to continue helping the user: their stats (age, weight, height, gender),
+goals, preferences, limitations, and any numbers or plans already calculated. Be concise."""
+
+
+def _format_for_summary(messages) -> str:
+    """Render history entries as plain text for the summarization prompt."""
+    lines = []
+    for message in messages:
+        role = message["role"]
+        content = message.get("content")
+        if not content:
+            continue
+        if role == "tool":
+            lines.append(f"Tool result ({message['name']}): {content[:500]}")
+        elif role == "system":
+            lines.append(content)
+        else:
+            lines.append(f"{role.capitalize()}: {content}")
+    return "\n".join(lines)
+
+
+async def compact_history(messages: list) -> list:
+    """
+    Replace all but the most recent turns with a rolling LLM-generated summary.
+
+    The system message stays at index 0 so the cached prompt prefix is unchanged.
+
+    Args:
+        messages: Conversation history, starting with the system message
+
+    Returns:
+        The compacted history, or the original history if nothing needed compacting
+    """
+    turn_starts = [i for i, m in enumerate(messages) if m["role"] == "user"]
+    if len(turn_starts) < MAX_RECENT_TURNS + SUMMARY_BATCH_TURNS:
+        return messages
+
+    # Everything between the system message and the oldest kept turn, including
+    # any previous summary, is folded into the new summary
+    keep_from = turn_starts[-MAX_RECENT_TURNS]
+    older = messages[1:keep_from]
+
+    try:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": _format_for_summary(older)}
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS
+        )
+        summary = (response.choices[0].message.content or "").strip()
+    except Exception as e:
+        logger.warning(f"Could not summarize conversation history: {str(e)}")
+        return messages
+
+    # No content (e.g. a refusal): keep the full history rather than lose it
+    if not summary:
+        logger.warning("Conversation summary came back empty")
+        return messages
+
+    return [
+        messages[0],
+        {"role": "system", "content": SUMMARY_PREFIX + summary},
+        *messages[keep_from:]
+    ]
+
+
+def log_usage(usage) -> None:
+    """
+    Log prompt token usage, including tokens served from OpenAI's prompt cache.
+
+    Args:
+        usage: The usage object from a chat completion response (may be None)
+    """
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+    logger.info(f"Prompt tokens: {usage.prompt_tokens} (cached: {cached_tokens})")
+
+
+async def embed_message(text: str):
+    """
+    Embed a user message for the semantic cache.
+
+    Args:
+        text: The user's input message
+
+    Returns:
+        The embedding vector, or None if the embedding request failed
+    """
+    try:
+        return await embedding_batcher.embed(text)
+    except Exception:
+        return None
+
+
+async def stream_completion(msg: cl.Message, messages: list, tool_choice: str, model: str = MODEL):
+    """
+    Stream a chat completion into a Chainlit message.
+
+    Content tokens are forwarded to the UI as soon as they arrive, so replies
+    that need no tools start rendering immediately. Tool call fragments are
+    reassembled by index. The tools are always sent, even when disabled with
+    tool_choice="none", so every request shares the cached prompt prefix.
+    Parallel tool calls are requested explicitly so a message asking for
+    several calculations is answered with one tool round rather than several.
+
+    Args:
+        msg: The Chainlit message to stream tokens into
+        messages: Conversation history to send
+        tool_choice: "auto" to let the model call tools, "none" to disable them
+        model: The OpenAI model to use
+
+    Returns:
+        Tuple of (streamed content, list of tool call dicts in the API's format)
+    """
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        tools=TOOLS,
+        tool_choice=tool_choice,
+        parallel_tool_calls=True,
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+
+    content = ""
+    tool_calls = {}
+    # The last chunk carries usage and no choices
+    async for chunk in stream:
+        if chunk.usage:
+            log_usage(chunk.usage)
+        if not chunk.choices:
+            continue
+
+        delta = chunk.choices[0].delta
+        if delta.content:
+            content += delta.content
+            await msg.stream_token(delta.content)
+
+        for fragment in delta.tool_calls or []:
+            tool_call = tool_calls.setdefault(fragment.index, {
+                "id": "",
+                "type": "function",
+                "function": {"name": "", "arguments": ""}
+            })
+            if fragment.id:
+                tool_call["id"] = fragment.id
+            if fragment.function:
+                if fragment.function.name:
+                    tool_call["function"]["name"] += fragment.function.name
+                if fragment.function.arguments:
+                    tool_call["function"]["arguments"] += fragment.function.arguments
+
+    return content, [tool_calls[index] for index in sorted(tool_calls)]
+
+
+async def stream_tool_banners(msg: cl.Message, tool_calls: list) -> None:
+    """
+    Stream a "Using tool" banner for each tool call, in order.
+
+    Args:
+        msg: The Chainlit message to stream tokens into
+        tool_calls: Tool call dicts as returned by stream_completion
+    """
+    for tool_call in tool_calls:
+        await msg.stream_token(f"\n\n🔧 Using tool: **{tool_call['function']['name']}**\n\n")
+
 
 @cl.on_chat_start
 async def start():
     """Called when a new chat session starts."""
     # Initialize conversation history
-    cl.user_session.set("messages", [{"role": "system", "content": SYSTEM_PROMPT}])
+    cl.user_session.set("messages", [dict(SYSTEM_MESSAGE)])
 
     await cl.Message(
         content="""👋 Welcome to **Elicia AI - Your Health & Fitness Coach!**
@@ -95,70 +314,119 @@ async def main(message: cl.Message):
     # Add user message to history
     messages.append({"role": "user", "content": message.content})
 
+    # Only single-turn conversations (system + user) are cacheable
+    first_turn = len(messages) == 2
+
     # Create a placeholder for the response
     msg = cl.Message(content="")
     await msg.send()
 
     try:
-        # Call OpenAI API with function calling
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            tools=TOOLS,
-            tool_choice="auto"
-        )
-
-        response_message = response.choices[0].message
-        tool_calls = response_message.tool_calls
+        # Plain calculation requests are answered from the tools alone; everything
+        # else goes to the cheapest model that can handle it
+        guesses = guess_tool_calls(message.content)
+        route_name = route(message.content, guesses, first_turn)
+        if route_name == DIRECT_TOOL:
+            results = await asyncio.gather(*(
+                asyncio.to_thread(execute_function_json, name, args) for name, args in guesses
+            ))
+            direct_content = format_direct_answer(
+                [(name, json.loads(result)) for (name, _), result in zip(guesses, results)]
+            )
+            if direct_content is not None:
+                messages.append({"role": "assistant", "content": direct_content})
+                await msg.stream_token(direct_content)
+                await msg.update()
+                cl.user_session.set("messages", await compact_history(messages))
+                return
+        model = ROUTE_MODELS.get(route_name, MODEL)
+
+        # Answer repeated tool-free prompts straight from the cache, falling
+        # back to a similarity search over previous number-free questions
+        embedding = None
+        if first_turn:
+            cached_content = get_cached_response(model, SYSTEM_PROMPT, message.content)
+            if cached_content is None and not _HAS_DIGIT.search(message.content):
+                embedding = await embed_message(message.content)
+                if embedding is not None:
+                    cached_content = semantic_cache.lookup(embedding)
+            if cached_content is not None:
+                messages.append({"role": "assistant", "content": cached_content})
+                await msg.stream_token(cached_content)
+                await msg.update()
+                cl.user_session.set("messages", messages)
+                return
+
+        # Speculatively start any calculator the message obviously asks for,
+        # so it runs while the model is still deciding which tools to call
+        prefetched = [
+            (name, args, asyncio.create_task(asyncio.to_thread(execute_function_json, name, args)))
+            for name, args in guesses
+        ]
+
+        # Call OpenAI API with function calling, streaming any direct answer
+        content, tool_calls = await stream_completion(msg, messages, tool_choice="auto", model=model)
 
         # If the model wants to call functions
         if tool_calls:
-            # Add assistant's response to messages
-            messages.append(response_message)
-
-            # Execute each function call
+            # Execute all function calls concurrently in worker threads, reusing
+            # a prefetched result when the model asked for exactly that call.
+            # Malformed arguments get an error reply instead of raising, so every
+            # call is answered.
+            pending = []
             for tool_call in tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                # Show what tool is being used
-                await msg.stream_token(f"\n\n🔧 Using tool: **{function_name}**\n\n")
-
-                # Execute the function
-                function_response = execute_function(function_name, function_args)
+                function_name = tool_call["function"]["name"]
+                try:
+                    function_args = json.loads(tool_call["function"]["arguments"] or "{}")
+                except json.JSONDecodeError as e:
+                    error = json.dumps({"error": f"Invalid arguments: {e}"})
+                    pending.append(asyncio.sleep(0, result=error))
+                    continue
+                task = next(
+                    (task for name, args, task in prefetched
+                     if name == function_name and args == function_args),
+                    None
+                )
+                if task is None:
+                    task = asyncio.to_thread(execute_function_json, function_name, function_args)
+                pending.append(task)
+
+            # Show which tools are being used while they run
+            _, *function_responses = await asyncio.gather(
+                stream_tool_banners(msg, tool_calls),
+                *pending
+            )
 
-                # Add function response to messages
+            # Only now that every call has a reply is the tool turn added to the
+            # history, with responses in the original tool_call order
+            messages.append({"role": "assistant", "content": content or None, "tool_calls": tool_calls})
+            for tool_call, function_response in zip(tool_calls, function_responses):
                 messages.append({
-                    "tool_call_id": tool_call.id,
+                    "tool_call_id": tool_call["id"],
                     "role": "tool",
-                    "name": function_name,
-                    "content": json.dumps(function_response)
+                    "name": tool_call["function"]["name"],
+                    "content": function_response
                 })
 
-            # Get final response from the model with function results
-            second_response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                stream=True
-            )
-
-            # Stream the final response
-            for chunk in second_response:
-                if chunk.choices[0].delta.content:
-                    await msg.stream_token(chunk.choices[0].delta.content)
+            # Stream the final response from the model with function results
+            await stream_completion(msg, messages, tool_choice="none", model=model)
 
             # Update message history with assistant's final response
             final_content = msg.content
             messages.append({"role": "assistant", "content": final_content})
         else:
-            # No function call, stream regular response
-            messages.append({"role": "assistant", "content": response_message.content})
-            await msg.stream_token(response_message.content)
+            # No function call, the answer has already been streamed
+            messages.append({"role": "assistant", "content": content})
+            if first_turn:
+                cache_response(model, SYSTEM_PROMPT, message.content, content)
+                # Only set for number-free messages, see _HAS_DIGIT
+                if embedding is not None:
+                    semantic_cache.add(embedding, content)
 
         await msg.update()
 
-        # Save updated conversation history
-        cl.user_session.set("messages", messages)
+        # Save updated conversation history, summarizing old turns once it grows
+        cl.user_session.set("messages", await compact_history(messages))
 
     except Exception as e:
         await cl.Message(content=f"❌ Error: {str(e)}").send()
@@ -0,0 +1,111 @@
+"""
+Tests for parsing calculator calls from messages and routing them.
+
+The direct_tool route answers without calling the LLM, so a wrong parse is
+sent to the user as-is.
+"""
+import pytest
+
+from tools.prefetch import guess_tool_calls, has_ambiguous_measurements
+from utils.router import DIRECT_TOOL, MINI, NANO, route
+
+
+BMI_80_180 = ("calculate_bmi", {"weight_kg": 80.0, "height_cm": 180.0})
+
+
+@pytest.mark.parametrize("message", [
+    "my goal is 70kg. currently 90kg, 180cm. bmi?",
+    "I was 95kg, now 80kg at 180cm - bmi?",
+    "80kg, 180cm, or 182cm with shoes - bmi?",
+    "I'm 30, 30 years old male, moderate, 80kg, 180cm, tdee?"
+])
+def test_repeated_measurements_are_not_guessed(message):
+    assert has_ambiguous_measurements(message)
+    assert guess_tool_calls(message) == []
+
+
+@pytest.mark.parametrize("message", [
+    "my goal is 70kg. currently 90kg, 180cm. bmi?",
+    "I was 95kg, now 80kg at 180cm - bmi?"
+])
+def test_repeated_measurements_never_route_direct(message):
+    # Even if a caller passes guesses, an ambiguous message goes to the LLM
+    assert route(message, [BMI_80_180], first_turn=True) != DIRECT_TOOL
+
+
+@pytest.mark.parametrize("message", [
+    "80kg 180cm bmi?",
+    "80 kg and 180 cm, what's my bmi",
+    "80 kgs, 180 centimeters, body mass index?",
+    "80 kilos and 180 centimetres, BMI please",
+    "80 kilograms, 180cm - bmi"
+])
+def test_unit_variants(message):
+    guesses = guess_tool_calls(message)
+    assert guesses == [BMI_80_180]
+    assert route(message, guesses, first_turn=True) == DIRECT_TOOL
+
+
+def test_tdee_guess():
+    message = "I'm 30, male, moderately active, 80kg, 180cm. tdee?"
+    assert guess_tool_calls(message) == [("calculate_tdee", {
+        "weight_kg": 80.0,
+        "height_cm": 180.0,
+        "age": 30,
+        "gender": "male",
+        "activity_level": "moderate"
+    })]
+
+
+@pytest.mark.parametrize("message", [
+    "I'm 30, male, not very active, 80kg, 180cm. tdee?",
+    "I'm 30, male, used to be sedentary, now active, 80kg, 180cm. tdee?",
+    "I'm 30, male, active, my wife is female, 80kg, 180cm. tdee?",
+    "I'm 30, not a woman, active, 80kg, 180cm. tdee?"
+])
+def test_conflicting_or_negated_tdee_inputs_are_not_guessed(message):
+    guesses = guess_tool_calls(message)
+    assert guesses == []
+    assert route(message, guesses, first_turn=True) != DIRECT_TOOL
+
+
+@pytest.mark.parametrize("message", [
+    "I'm 80 kilos, 180cm, male, moderately active. tdee?",
+    "I'm 180 centimeters, 80kg, female, active, tdee?",
+    "I'm 80 kilograms and 180 cm, age unknown, male, active - tdee?"
+])
+def test_measurement_is_not_read_as_age(message):
+    guesses = guess_tool_calls(message)
+    assert guesses == []
+    assert route(message, guesses, first_turn=True) != DIRECT_TOOL
+
+
+@pytest.mark.parametrize("message", [
+    "80kg, bmi?",
+    "I'm 180cm, what's my bmi?",
+    "what's a healthy bmi?",
+    "80kg 180cm"
+])
+def test_partial_input_is_not_guessed(message):
+    guesses = guess_tool_calls(message)
+    assert guesses == []
+    assert route(message, guesses, first_turn=True) != DIRECT_TOOL
+
+
+def test_tdee_without_all_inputs_goes_to_llm():
+    # BMI can be computed, but the requested TDEE can't, so the LLM answers
+    message = "80kg 180cm, male, what are my bmi and calories?"
+    guesses = guess_tool_calls(message)
+    assert guesses == [BMI_80_180]
+    assert route(message, guesses, first_turn=True) != DIRECT_TOOL
+
+
+def test_other_topics_go_to_llm():
+    message = "80kg 180cm, bmi and how much water should I drink?"
+    assert route(message, guess_tool_calls(message), first_turn=True) != DIRECT_TOOL
+
+
+def test_model_routes():
+    assert route("what's a good protein source?", [], first_turn=True) == NANO
+    assert route("what's a good protein source?", [], first_turn=False) == MINI
+    assert route("x" * 500, [], first_turn=True) == MINI
@@ -0,0 +1,109 @@
+"""
+Tests for the compiled argument validator and the errors execute_function
+returns for calls that don't match a tool's schema.
+"""
+import pytest
+
+from tools.tool_registry import execute_function
+from utils.schema_validator import SchemaValidationError, compile_schema
+
+
+NESTED = compile_schema({
+    "type": "object",
+    "properties": {
+        "profile": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"]
+        },
+        "sets": {
+            "type": "array",
+            "items": {"type": "array", "items": {"type": "integer"}}
+        }
+    }
+})
+
+RANGE = compile_schema({"type": "integer", "minimum": 3, "maximum": 6})
+
+WORKOUT = {"goal": "strength", "level": "beginner", "days_per_week": 3, "equipment": ["barbell"]}
+
+
+def _error(validate, value):
+    with pytest.raises(SchemaValidationError) as excinfo:
+        validate(value)
+    return str(excinfo.value)
+
+
+def test_valid_values_pass():
+    NESTED({"profile": {"name": "Ana"}, "sets": [[5, 5], [3]]})
+    NESTED({})
+    RANGE(3)
+    RANGE(6)
+
+
+def test_nested_property_path():
+    assert _error(NESTED, {"profile": {"name": 1}}) == "profile.name must be of type string"
+    assert _error(NESTED, {"profile": {}}) == "profile is missing required property 'name'"
+
+
+def test_items_index_path():
+    assert _error(NESTED, {"sets": [[5], [5, "x"]]}) == "sets[1][1] must be of type integer"
+    assert _error(compile_schema({"items": {"type": "integer"}}), [1, 2, "x"]) == (
+        "arguments[2] must be of type integer"
+    )
+
+
+def test_enum():
+    validate = compile_schema({"type": "string", "enum": ["male", "female"]})
+    validate("female")
+    assert _error(validate, "other") == "arguments must be one of ['male', 'female']"
+
+
+def test_minimum_and_maximum():
+    assert _error(RANGE, 2) == "arguments must be >= 3"
+    assert _error(RANGE, 7) == "arguments must be <= 6"
+
+
+def test_integral_floats_are_integers():
+    RANGE(4.0)
+    assert _error(RANGE, 4.5) == "arguments must be of type integer"
+
+
+def test_booleans_are_not_numbers():
+    assert _error(compile_schema({"type": "number"}), True) == "arguments must be of type number"
+    assert _error(RANGE, False) == "arguments must be of type integer"
+
+
+def test_empty_schema_accepts_anything():
+    validate = compile_schema({"description": "anything"})
+    validate(None)
+    validate([1, "a"])
+
+
+@pytest.mark.parametrize("name, arguments, error", [
+    ("calculate_bmi", {"weight_kg": "80", "height_cm": 180},
+     "Invalid arguments: weight_kg must be of type number"),
+    ("calculate_bmi", {"weight_kg": 80},
+     "Invalid arguments: arguments is missing required property 'height_cm'"),
+    ("calculate_bmi", [80, 180], "Invalid arguments: arguments must be of type object"),
+    ("calculate_bmi", None, "Invalid arguments: arguments must be of type object"),
+    ("generate_workout", {**WORKOUT, "days_per_week": 7},
+     "Invalid arguments: days_per_week must be <= 6"),
+    ("generate_workout", {**WORKOUT, "days_per_week": 3.5},
+     "Invalid arguments: days_per_week must be of type integer"),
+    ("generate_workout", {**WORKOUT, "equipment": ["barbell", 2]},
+     "Invalid arguments: equipment[1] must be of type string"),
+    ("generate_workout", {**WORKOUT, "level": "expert"},
+     "Invalid arguments: level must be one of ['beginner', 'intermediate', 'advanced']"),
+    ("no_such_tool", {}, "Function 'no_such_tool' not found")
+])
+def test_execute_function_errors(name, arguments, error):
+    assert execute_function(name, arguments) == {"error": error}
+
+
+def test_execute_function_accepts_integral_float():
+    result = execute_function("calculate_tdee", {
+        "weight_kg": 80, "height_cm": 180, "age": 30.0,
+        "gender": "male", "activity_level": "moderate"
+    })
+    assert "error" not in result
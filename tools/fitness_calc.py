@@ -1,8 +1,42 @@
 """
 Fitness calculation tools for health and fitness metrics.
 """
-import json
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Dict, Any
+
+
+# One rep max training zones: (zone, reps, purpose), with the matching
+# low/high fractions of 1RM in _ONE_REP_MAX_BOUNDS
+_ONE_REP_MAX_ZONES = (
+    ("strength", "1-5", "Maximum strength development"),
+    ("hypertrophy", "6-12", "Muscle growth"),
+    ("endurance", "12-20+", "Muscular endurance")
+)
+_ONE_REP_MAX_BOUNDS = np.array([[0.80, 0.95], [0.65, 0.85], [0.50, 0.70]])
+_ONE_REP_MAX_PERCENTAGES = tuple(
+    f"{low * 100:.0f}-{high * 100:.0f}%" for low, high in _ONE_REP_MAX_BOUNDS.tolist()
+)
+
+# Heart rate training zones: (zone, purpose, intensity). Zone i spans
+# _HEART_RATE_ZONE_BOUNDS[i] to _HEART_RATE_ZONE_BOUNDS[i + 1] of max heart rate
+_HEART_RATE_ZONES = (
+    ("zone_1_recovery", "Warm-up, cool-down, recovery", "Very light"),
+    ("zone_2_fat_burn", "Fat burning, base fitness", "Light"),
+    ("zone_3_aerobic", "Aerobic fitness, endurance", "Moderate"),
+    ("zone_4_anaerobic", "Performance, speed, power", "Hard"),
+    ("zone_5_max", "Maximum effort, sprints", "Maximum")
+)
+_HEART_RATE_ZONE_BOUNDS = np.array([0.50, 0.60, 0.70, 0.80, 0.90, 1.00])
+_HEART_RATE_PERCENTAGES = tuple(
+    f"{low * 100:.0f}-{high * 100:.0f}%"
+    for low, high in zip(_HEART_RATE_ZONE_BOUNDS.tolist(), _HEART_RATE_ZONE_BOUNDS[1:].tolist())
+)
 
 
 def calculate_bmi(weight_kg: float, height_cm: float) -> Dict[str, Any]:
@@ -192,27 +226,20 @@ def calculate_one_rep_max(weight: float, reps: int) -> Dict[str, Any]:
         # Epley formula
         one_rm = weight * (1 + reps / 30)
 
+    # All zone weights in one multiply; Python's round() keeps exact decimal rounding
+    weights = (one_rm * _ONE_REP_MAX_BOUNDS).tolist()
+
     return {
         "one_rep_max": round(one_rm, 1),
         "training_zones": {
-            "strength": {
-                "percentage": "80-95%",
-                "weight_range": f"{round(one_rm * 0.80, 1)}-{round(one_rm * 0.95, 1)}",
-                "reps": "1-5",
-                "purpose": "Maximum strength development"
-            },
-            "hypertrophy": {
-                "percentage": "65-85%",
-                "weight_range": f"{round(one_rm * 0.65, 1)}-{round(one_rm * 0.85, 1)}",
-                "reps": "6-12",
-                "purpose": "Muscle growth"
-            },
-            "endurance": {
-                "percentage": "50-70%",
-                "weight_range": f"{round(one_rm * 0.50, 1)}-{round(one_rm * 0.70, 1)}",
-                "reps": "12-20+",
-                "purpose": "Muscular endurance"
+            zone: {
+                "percentage": percentage,
+                "weight_range": f"{round(low, 1)}-{round(high, 1)}",
+                "reps": zone_reps,
+                "purpose": purpose
             }
+            for (zone, zone_reps, purpose), percentage, (low, high)
+            in zip(_ONE_REP_MAX_ZONES, _ONE_REP_MAX_PERCENTAGES, weights)
         }
     }
 
@@ -287,40 +314,21 @@ def calculate_heart_rate_zones(age: int) -> Dict[str, Any]:
     """
     max_hr = 220 - age
 
+    # Every zone boundary in one multiply (rint rounds half to even, like round())
+    bounds = np.rint(max_hr * _HEART_RATE_ZONE_BOUNDS).astype(int).tolist()
+
     return {
         "max_heart_rate": max_hr,
         "resting_recommendation": "60-100 bpm for adults",
         "training_zones": {
-            "zone_1_recovery": {
-                "percentage": "50-60%",
-                "heart_rate": f"{round(max_hr * 0.50)}-{round(max_hr * 0.60)} bpm",
-                "purpose": "Warm-up, cool-down, recovery",
-                "intensity": "Very light"
-            },
-            "zone_2_fat_burn": {
-                "percentage": "60-70%",
-                "heart_rate": f"{round(max_hr * 0.60)}-{round(max_hr * 0.70)} bpm",
-                "purpose": "Fat burning, base fitness",
-                "intensity": "Light"
-            },
-            "zone_3_aerobic": {
-                "percentage": "70-80%",
-                "heart_rate": f"{round(max_hr * 0.70)}-{round(max_hr * 0.80)} bpm",
-                "purpose": "Aerobic fitness, endurance",
-                "intensity": "Moderate"
-            },
-            "zone_4_anaerobic": {
-                "percentage": "80-90%",
-                "heart_rate": f"{round(max_hr * 0.80)}-{round(max_hr * 0.90)} bpm",
-                "purpose": "Performance, speed, power",
-                "intensity": "Hard"
-            },
-            "zone_5_max": {
-                "percentage": "90-100%",
-                "heart_rate": f"{round(max_hr * 0.90)}-{max_hr} bpm",
-                "purpose": "Maximum effort, sprints",
-                "intensity": "Maximum"
+            zone: {
+                "percentage": percentage,
+                "heart_rate": f"{low}-{high} bpm",
+                "purpose": purpose,
+                "intensity": intensity
             }
+            for (zone, purpose, intensity), percentage, low, high
+            in zip(_HEART_RATE_ZONES, _HEART_RATE_PERCENTAGES, bounds, bounds[1:])
         }
     }
 
@@ -1,9 +1,106 @@
 """
 Nutrition planning and meal generation tools.
 """
-import json
-from typing import Dict, List, Any
-import random
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Any, Mapping, Optional
+
+
+# Common foods database (per 100g): (calories, protein, carbs, fat). Keys are
+# lowercase so lookups only have to normalize the query
+_NUTRITION_DB = {
+    "chicken breast": (165, 31, 0, 3.6),
+    "salmon": (208, 20, 0, 13),
+    "egg": (143, 13, 1, 10),
+    "greek yogurt": (59, 10, 3.6, 0.4),
+    "oatmeal": (389, 17, 66, 7),
+    "brown rice": (370, 7.5, 77, 2.9),
+    "broccoli": (34, 2.8, 7, 0.4),
+    "sweet potato": (86, 1.6, 20, 0.1),
+    "banana": (89, 1.1, 23, 0.3),
+    "almonds": (579, 21, 22, 50),
+    "avocado": (160, 2, 9, 15),
+    "quinoa": (368, 14, 64, 6),
+    "tuna": (130, 28, 0, 1),
+    "beef": (250, 26, 0, 15),
+    "turkey": (135, 30, 0, 0.7),
+    "cottage cheese": (98, 11, 3.4, 4.3),
+    "milk": (42, 3.4, 5, 1),
+    "apple": (52, 0.3, 14, 0.2),
+    "peanut butter": (588, 25, 20, 50),
+    "spinach": (23, 2.9, 3.6, 0.4),
+    "pasta": (371, 13, 75, 1.5),
+    "bread": (265, 9, 49, 3.2),
+    "cheese": (402, 25, 1.3, 33)
+}
+
+# Structure-of-arrays view of the database for vectorized meal calculations:
+# one row per food, columns are calories, protein, carbs, fat
+_NUTRIENT_FIELDS = ("calories", "protein", "carbs", "fat")
+_FOOD_INDEX = {food: row for row, food in enumerate(_NUTRITION_DB)}
+_NUTRIENTS = np.array(list(_NUTRITION_DB.values()), dtype=np.float64)
+
+# Complete get_nutrition_info payloads, built once per food and shared read-only
+_NUTRITION_RESPONSES = tuple(
+    MappingProxyType({
+        "food": food.title(),
+        "serving_size": "100g",
+        "nutrition": MappingProxyType(dict(zip(_NUTRIENT_FIELDS, values))),
+        "found": True
+    })
+    for food, values in _NUTRITION_DB.items()
+)
+
+
+# Healthier swaps for common foods. Alternatives are tuples because they are
+# handed out to callers as-is
+_ALTERNATIVES_DB = {
+    "white rice": {
+        "alternatives": ("Brown rice", "Quinoa", "Cauliflower rice"),
+        "reason": "Higher fiber, more nutrients, better for blood sugar"
+    },
+    "white bread": {
+        "alternatives": ("Whole grain bread", "Ezekiel bread", "Oat bread"),
+        "reason": "More fiber, slower digestion, more vitamins"
+    },
+    "pasta": {
+        "alternatives": ("Whole wheat pasta", "Lentil pasta", "Zucchini noodles"),
+        "reason": "Higher protein/fiber, lower calories"
+    },
+    "soda": {
+        "alternatives": ("Sparkling water", "Green tea", "Water with lemon"),
+        "reason": "Zero calories, no sugar, better hydration"
+    },
+    "chips": {
+        "alternatives": ("Air-popped popcorn", "Veggie chips", "Rice cakes"),
+        "reason": "Lower calories, less fat, more filling"
+    },
+    "ice cream": {
+        "alternatives": ("Greek yogurt with fruit", "Protein ice cream", "Frozen banana"),
+        "reason": "Higher protein, lower sugar, fewer calories"
+    },
+    "candy": {
+        "alternatives": ("Dark chocolate", "Fruit", "Dates"),
+        "reason": "Natural sugars, antioxidants, fiber"
+    },
+    "fried chicken": {
+        "alternatives": ("Grilled chicken", "Baked chicken", "Air-fried chicken"),
+        "reason": "Less fat, fewer calories, same protein"
+    }
+}
+
+
+@lru_cache(maxsize=512)
+def _lookup(food_item: str) -> Optional[int]:
+    """Resolve a food name to its database row, or None if it isn't in the database."""
+    return _FOOD_INDEX.get(food_item.lower().strip())
 
 
 def generate_meal_plan(
@@ -129,7 +226,7 @@ def _get_meal_suggestions(meal_name: str, dietary_preference: str) -> List[str]:
     return suggestions.get(meal_name, suggestions["Snack"])[:3]
 
 
-def get_nutrition_info(food_item: str) -> Dict[str, Any]:
+def get_nutrition_info(food_item: str) -> Mapping[str, Any]:
     """
     Get nutrition information for common foods.
 
@@ -137,45 +234,12 @@ def get_nutrition_info(food_item: str) -> Dict[str, Any]:
         food_item: Name of the food
 
     Returns:
-        Nutrition information per 100g serving
+        Nutrition information per 100g serving (read-only for foods in the database)
     """
-    # Common foods database (per 100g)
-    nutrition_db = {
-        "chicken breast": {"calories": 165, "protein": 31, "carbs": 0, "fat": 3.6},
-        "salmon": {"calories": 208, "protein": 20, "carbs": 0, "fat": 13},
-        "egg": {"calories": 143, "protein": 13, "carbs": 1, "fat": 10},
-        "greek yogurt": {"calories": 59, "protein": 10, "carbs": 3.6, "fat": 0.4},
-        "oatmeal": {"calories": 389, "protein": 17, "carbs": 66, "fat": 7},
-        "brown rice": {"calories": 370, "protein": 7.5, "carbs": 77, "fat": 2.9},
-        "broccoli": {"calories": 34, "protein": 2.8, "carbs": 7, "fat": 0.4},
-        "sweet potato": {"calories": 86, "protein": 1.6, "carbs": 20, "fat": 0.1},
-        "banana": {"calories": 89, "protein": 1.1, "carbs": 23, "fat": 0.3},
-        "almonds": {"calories": 579, "protein": 21, "carbs": 22, "fat": 50},
-        "avocado": {"calories": 160, "protein": 2, "carbs": 9, "fat": 15},
-        "quinoa": {"calories": 368, "protein": 14, "carbs": 64, "fat": 6},
-        "tuna": {"calories": 130, "protein": 28, "carbs": 0, "fat": 1},
-        "beef": {"calories": 250, "protein": 26, "carbs": 0, "fat": 15},
-        "turkey": {"calories": 135, "protein": 30, "carbs": 0, "fat": 0.7},
-        "cottage cheese": {"calories": 98, "protein": 11, "carbs": 3.4, "fat": 4.3},
-        "milk": {"calories": 42, "protein": 3.4, "carbs": 5, "fat": 1},
-        "apple": {"calories": 52, "protein": 0.3, "carbs": 14, "fat": 0.2},
-        "peanut butter": {"calories": 588, "protein": 25, "carbs": 20, "fat": 50},
-        "spinach": {"calories": 23, "protein": 2.9, "carbs": 3.6, "fat": 0.4},
-        "pasta": {"calories": 371, "protein": 13, "carbs": 75, "fat": 1.5},
-        "bread": {"calories": 265, "protein": 9, "carbs": 49, "fat": 3.2},
-        "cheese": {"calories": 402, "protein": 25, "carbs": 1.3, "fat": 33}
-    }
-
-    food_lower = food_item.lower().strip()
-    nutrition = nutrition_db.get(food_lower)
+    row = _lookup(food_item)
 
-    if nutrition:
-        return {
-            "food": food_item.title(),
-            "serving_size": "100g",
-            "nutrition": nutrition,
-            "found": True
-        }
+    if row is not None:
+        return _NUTRITION_RESPONSES[row]
     else:
         return {
             "food": food_item,
@@ -194,41 +258,34 @@ def calculate_meal_macros(ingredients: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Total nutrition for the meal
     """
-    total_calories = 0
-    total_protein = 0
-    total_carbs = 0
-    total_fat = 0
-
-    ingredient_breakdown = []
-
-    for ingredient in ingredients:
-        food_name = ingredient.get("food", "")
-        grams = ingredient.get("grams", 0)
-
-        food_data = get_nutrition_info(food_name)
-
-        if food_data.get("found"):
-            nutrition = food_data["nutrition"]
-            multiplier = grams / 100
-
-            cals = nutrition["calories"] * multiplier
-            protein = nutrition["protein"] * multiplier
-            carbs = nutrition["carbs"] * multiplier
-            fat = nutrition["fat"] * multiplier
-
-            total_calories += cals
-            total_protein += protein
-            total_carbs += carbs
-            total_fat += fat
-
-            ingredient_breakdown.append({
-                "food": food_name,
-                "grams": grams,
-                "calories": round(cals, 1),
-                "protein": round(protein, 1),
-                "carbs": round(carbs, 1),
-                "fat": round(fat, 1)
-            })
+    # Resolve all ingredient names up front; unknown foods are skipped
+    resolved = [_lookup(ingredient.get("food", "")) for ingredient in ingredients]
+
+    names = []
+    grams = []
+    rows = []
+    for ingredient, row in zip(ingredients, resolved):
+        if row is not None:
+            names.append(ingredient.get("food", ""))
+            grams.append(ingredient.get("grams", 0))
+            rows.append(row)
+
+    # One multiply scales every ingredient's per-100g values to its serving size
+    per_ingredient = _NUTRIENTS[rows] * (np.asarray(grams, dtype=np.float64)[:, None] / 100)
+    total_calories, total_protein, total_carbs, total_fat = per_ingredient.sum(axis=0).tolist()
+
+    ingredient_breakdown = [
+        {
+            "food": food_name,
+            "grams": food_grams,
+            "calories": round(cals, 1),
+            "protein": round(protein, 1),
+            "carbs": round(carbs, 1),
+            "fat": round(fat, 1)
+        }
+        for food_name, food_grams, (cals, protein, carbs, fat)
+        in zip(names, grams, per_ingredient.tolist())
+    ]
 
     return {
         "ingredients": ingredient_breakdown,
@@ -251,43 +308,7 @@ def get_healthy_alternatives(food_item: str) -> Dict[str, Any]:
     Returns:
         Healthier alternatives with reasons
     """
-    alternatives = {
-        "white rice": {
-            "alternatives": ["Brown rice", "Quinoa", "Cauliflower rice"],
-            "reason": "Higher fiber, more nutrients, better for blood sugar"
-        },
-        "white bread": {
-            "alternatives": ["Whole grain bread", "Ezekiel bread", "Oat bread"],
-            "reason": "More fiber, slower digestion, more vitamins"
-        },
-        "pasta": {
-            "alternatives": ["Whole wheat pasta", "Lentil pasta", "Zucchini noodles"],
-            "reason": "Higher protein/fiber, lower calories"
-        },
-        "soda": {
-            "alternatives": ["Sparkling water", "Green tea", "Water with lemon"],
-            "reason": "Zero calories, no sugar, better hydration"
-        },
-        "chips": {
-            "alternatives": ["Air-popped popcorn", "Veggie chips", "Rice cakes"],
-            "reason": "Lower calories, less fat, more filling"
-        },
-        "ice cream": {
-            "alternatives": ["Greek yogurt with fruit", "Protein ice cream", "Frozen banana"],
-            "reason": "Higher protein, lower sugar, fewer calories"
-        },
-        "candy": {
-            "alternatives": ["Dark chocolate", "Fruit", "Dates"],
-            "reason": "Natural sugars, antioxidants, fiber"
-        },
-        "fried chicken": {
-            "alternatives": ["Grilled chicken", "Baked chicken", "Air-fried chicken"],
-            "reason": "Less fat, fewer calories, same protein"
-        }
-    }
-
-    food_lower = food_item.lower().strip()
-    alt_data = alternatives.get(food_lower)
+    alt_data = _ALTERNATIVES_DB.get(food_item.lower().strip())
 
     if alt_data:
         return {
@@ -0,0 +1,147 @@
+"""
+Speculative tool prefetching.
+
+Cheap regex heuristics guess which calculator the model is about to call from
+the user's message, so the tool can run while the LLM request is in flight.
+A guess is only ever used if the model asks for exactly the same call.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_KG_UNITS = r"(?:kg|kgs|kilos?|kilograms?)"
+_CM_UNITS = r"(?:cm|centimeters?|centimetres?)"
+_WEIGHT_KG = re.compile(_NUMBER + r"\s*" + _KG_UNITS + r"\b", re.IGNORECASE)
+_HEIGHT_CM = re.compile(_NUMBER + r"\s*" + _CM_UNITS + r"\b", re.IGNORECASE)
+# "I'm 80 kilos" is a weight, not an age, so any unit after the number rules it out
+_AGE = re.compile(
+    r"\b(\d{1,3})\s*(?:years?[\s-]*old|y/?o|yrs?)\b"
+    r"|\b(?:i'?m|i am|age[d:]?)\s*(\d{1,3})\b"
+    r"(?!\s*(?:" + _KG_UNITS + "|" + _CM_UNITS + r"|lbs?|pounds?|ft|feet)\b|\s*%)",
+    re.IGNORECASE
+)
+_GENDER = re.compile(r"\b(?:(?P<female>female|woman|girl)|(?P<male>male|man|guy|boy))\b", re.IGNORECASE)
+# One alternation, so "very active" and "moderately active" each count as one level
+_ACTIVITY_LEVEL = re.compile(
+    r"\b(?:(?P<very_active>very[\s_-]*active)"
+    r"|(?P<sedentary>sedentary)"
+    r"|(?P<light>light(?:ly)?(?:[\s_-]*active)?)"
+    r"|(?P<moderate>moderate(?:ly)?(?:[\s_-]*active)?)"
+    r"|(?P<active>active))\b",
+    re.IGNORECASE
+)
+# A negation up to two words before a match, e.g. "not very active", "isn't really male"
+_NEGATED = re.compile(r"\b(?:not|never|no longer|hardly|barely|\w+n't)\s+(?:\w+\s+){0,2}$", re.IGNORECASE)
+
+_BMI_KEYWORDS = re.compile(r"\bbmi\b|body mass index", re.IGNORECASE)
+_TDEE_KEYWORDS = re.compile(
+    r"\btdee\b|\bbmr\b|calorie|maintenance|energy expenditure",
+    re.IGNORECASE
+)
+
+
+def _numbers(pattern: re.Pattern, text: str) -> List[float]:
+    """Every number the pattern captures in the text, in order."""
+    return [
+        float(next(group for group in match.groups() if group is not None))
+        for match in pattern.finditer(text)
+    ]
+
+
+def has_ambiguous_measurements(message: str) -> bool:
+    """
+    Check whether a message states the weight, height or age more than once.
+
+    A message like "my goal is 70kg, currently 90kg" can't safely be answered
+    from parsed numbers, because there's no way to tell which value is meant.
+
+    Args:
+        message: The user's input message
+
+    Returns:
+        True if any of the measurement patterns matches more than once
+    """
+    return any(len(_numbers(pattern, message)) > 1 for pattern in (_WEIGHT_KG, _HEIGHT_CM, _AGE))
+
+
+def _single_value(pattern: re.Pattern, text: str) -> Optional[str]:
+    """
+    The name of the one group the pattern matches in the text.
+
+    Returns None when different groups match ("used to be sedentary, now
+    active") or a match is negated ("not very active"), since guessing
+    either way could be wrong.
+    """
+    values = set()
+    for match in pattern.finditer(text):
+        if _NEGATED.search(text, 0, match.start()):
+            return None
+        values.add(match.lastgroup)
+    return values.pop() if len(values) == 1 else None
+
+
+def _parse_gender(text: str) -> Optional[str]:
+    return _single_value(_GENDER, text)
+
+
+def _parse_activity_level(text: str) -> Optional[str]:
+    return _single_value(_ACTIVITY_LEVEL, text)
+
+
+def requested_calculators(message: str) -> List[str]:
+    """
+    List the calculators a message asks for, whether or not all inputs are present.
+
+    Args:
+        message: The user's input message
+
+    Returns:
+        Names of the calculator functions the message mentions
+    """
+    requested = []
+    if _BMI_KEYWORDS.search(message):
+        requested.append("calculate_bmi")
+    if _TDEE_KEYWORDS.search(message):
+        requested.append("calculate_tdee")
+    return requested
+
+
+def guess_tool_calls(message: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Guess fully specified calculator calls from a user message.
+
+    Args:
+        message: The user's input message
+
+    Returns:
+        List of (function_name, arguments) pairs; empty when nothing can be guessed,
+        including when a measurement is stated more than once
+    """
+    if has_ambiguous_measurements(message):
+        return []
+
+    weights = _numbers(_WEIGHT_KG, message)
+    heights = _numbers(_HEIGHT_CM, message)
+    if not weights or not heights:
+        return []
+    weight_kg, height_cm = weights[0], heights[0]
+
+    guesses = []
+    if _BMI_KEYWORDS.search(message):
+        guesses.append(("calculate_bmi", {"weight_kg": weight_kg, "height_cm": height_cm}))
+
+    if _TDEE_KEYWORDS.search(message):
+        ages = _numbers(_AGE, message)
+        gender = _parse_gender(message)
+        activity_level = _parse_activity_level(message)
+        if ages and gender and activity_level:
+            guesses.append(("calculate_tdee", {
+                "weight_kg": weight_kg,
+                "height_cm": height_cm,
+                "age": int(ages[0]),
+                "gender": gender,
+                "activity_level": activity_level
+            }))
+
+    return guesses
@@ -2,329 +2,379 @@
 Tool registry for OpenAI function calling.
 Defines all available tools and maps them to their implementations.
 """
+import importlib
 import json
-from typing import Dict, Any, Callable
-from tools.fitness_calc import (
-    calculate_bmi,
-    calculate_tdee,
-    calculate_macros,
-    calculate_one_rep_max,
-    calculate_body_fat_navy,
-    calculate_heart_rate_zones,
-    calculate_hydration
-)
-from tools.workout_tools import (
-    generate_workout,
-    get_exercise_recommendations,
-    calculate_progressive_overload
-)
-from tools.nutrition_tools import (
-    generate_meal_plan,
-    get_nutrition_info,
-    calculate_meal_macros,
-    get_healthy_alternatives
-)
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Callable, NamedTuple, Optional, Tuple, Union
+from utils.schema_validator import SchemaValidationError, Validator, compile_schema
+
+__all__ = [
+    "TOOLS",
+    "FUNCTION_MAP",
+    "execute_function",
+    "execute_function_json"
+]
+
+if TYPE_CHECKING:
+    # Visible to IDEs and type checkers only; at runtime TOOLS is built and
+    # the tool modules are imported on first use
+    TOOLS: Tuple[Dict[str, Any], ...]
+
+    from tools.fitness_calc import (
+        calculate_bmi,
+        calculate_tdee,
+        calculate_macros,
+        calculate_one_rep_max,
+        calculate_body_fat_navy,
+        calculate_heart_rate_zones,
+        calculate_hydration
+    )
+    from tools.workout_tools import (
+        generate_workout,
+        get_exercise_recommendations,
+        calculate_progressive_overload
+    )
+    from tools.nutrition_tools import (
+        generate_meal_plan,
+        get_nutrition_info,
+        get_healthy_alternatives
+    )
+
+
+class ToolDef(NamedTuple):
+    """A tool: its OpenAI definition and the module implementing it."""
+    name: str
+    description: str
+    module: str
+    parameters: Dict[str, Any]
 
 
-# OpenAI function definitions
-TOOLS = [
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_bmi",
-            "description": "Calculate Body Mass Index (BMI) and provide health assessment with recommendations",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "weight_kg": {
-                        "type": "number",
-                        "description": "Weight in kilograms"
-                    },
-                    "height_cm": {
-                        "type": "number",
-                        "description": "Height in centimeters"
-                    }
+# Tool definitions. The parameter schemas stay plain dicts because the OpenAI
+# SDK's JSON encoder only accepts dicts, not read-only mapping proxies.
+_TOOL_DEFS: Tuple[ToolDef, ...] = (
+    ToolDef(
+        name="calculate_bmi",
+        description="Calculate Body Mass Index (BMI) and provide health assessment with recommendations",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "weight_kg": {
+                    "type": "number",
+                    "description": "Weight in kilograms"
                 },
-                "required": ["weight_kg", "height_cm"]
-            }
+                "height_cm": {
+                    "type": "number",
+                    "description": "Height in centimeters"
+                }
+            },
+            "required": ["weight_kg", "height_cm"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_tdee",
-            "description": "Calculate Total Daily Energy Expenditure (TDEE) and daily calorie needs based on activity level",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "weight_kg": {"type": "number", "description": "Weight in kilograms"},
-                    "height_cm": {"type": "number", "description": "Height in centimeters"},
-                    "age": {"type": "integer", "description": "Age in years"},
-                    "gender": {"type": "string", "enum": ["male", "female"], "description": "Gender"},
-                    "activity_level": {
-                        "type": "string",
-                        "enum": ["sedentary", "light", "moderate", "active", "very_active"],
-                        "description": "Physical activity level"
-                    }
-                },
-                "required": ["weight_kg", "height_cm", "age", "gender", "activity_level"]
-            }
+    ),
+    ToolDef(
+        name="calculate_tdee",
+        description="Calculate Total Daily Energy Expenditure (TDEE) and daily calorie needs based on activity level",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "weight_kg": {"type": "number", "description": "Weight in kilograms"},
+                "height_cm": {"type": "number", "description": "Height in centimeters"},
+                "age": {"type": "integer", "description": "Age in years"},
+                "gender": {"type": "string", "enum": ["male", "female"], "description": "Gender"},
+                "activity_level": {
+                    "type": "string",
+                    "enum": ["sedentary", "light", "moderate", "active", "very_active"],
+                    "description": "Physical activity level"
+                }
+            },
+            "required": ["weight_kg", "height_cm", "age", "gender", "activity_level"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_macros",
-            "description": "Calculate macronutrient distribution (protein, carbs, fat) based on calorie goal and fitness objective",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "calories": {"type": "number", "description": "Daily calorie target"},
-                    "goal": {
-                        "type": "string",
-                        "enum": ["muscle_gain", "fat_loss", "maintenance"],
-                        "description": "Fitness goal"
-                    },
-                    "weight_kg": {"type": "number", "description": "Body weight in kg"}
+    ),
+    ToolDef(
+        name="calculate_macros",
+        description="Calculate macronutrient distribution (protein, carbs, fat) based on calorie goal and fitness objective",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "calories": {"type": "number", "description": "Daily calorie target"},
+                "goal": {
+                    "type": "string",
+                    "enum": ["muscle_gain", "fat_loss", "maintenance"],
+                    "description": "Fitness goal"
                 },
-                "required": ["calories", "goal", "weight_kg"]
-            }
+                "weight_kg": {"type": "number", "description": "Body weight in kg"}
+            },
+            "required": ["calories", "goal", "weight_kg"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_one_rep_max",
-            "description": "Calculate one rep max (1RM) and training zone recommendations for strength training",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "weight": {"type": "number", "description": "Weight lifted"},
-                    "reps": {"type": "integer", "description": "Number of repetitions performed"}
-                },
-                "required": ["weight", "reps"]
-            }
+    ),
+    ToolDef(
+        name="calculate_one_rep_max",
+        description="Calculate one rep max (1RM) and training zone recommendations for strength training",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "weight": {"type": "number", "description": "Weight lifted"},
+                "reps": {"type": "integer", "description": "Number of repetitions performed"}
+            },
+            "required": ["weight", "reps"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_body_fat_navy",
-            "description": "Estimate body fat percentage using US Navy method based on body measurements",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "gender": {"type": "string", "enum": ["male", "female"]},
-                    "waist_cm": {"type": "number", "description": "Waist circumference in cm"},
-                    "neck_cm": {"type": "number", "description": "Neck circumference in cm"},
-                    "height_cm": {"type": "number", "description": "Height in cm"},
-                    "hip_cm": {"type": "number", "description": "Hip circumference in cm (required for females)"}
-                },
-                "required": ["gender", "waist_cm", "neck_cm", "height_cm"]
-            }
+    ),
+    ToolDef(
+        name="calculate_body_fat_navy",
+        description="Estimate body fat percentage using US Navy method based on body measurements",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "gender": {"type": "string", "enum": ["male", "female"]},
+                "waist_cm": {"type": "number", "description": "Waist circumference in cm"},
+                "neck_cm": {"type": "number", "description": "Neck circumference in cm"},
+                "height_cm": {"type": "number", "description": "Height in cm"},
+                "hip_cm": {"type": "number", "description": "Hip circumference in cm (required for females)"}
+            },
+            "required": ["gender", "waist_cm", "neck_cm", "height_cm"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_heart_rate_zones",
-            "description": "Calculate heart rate training zones for cardio workouts",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "age": {"type": "integer", "description": "Age in years"}
-                },
-                "required": ["age"]
-            }
+    ),
+    ToolDef(
+        name="calculate_heart_rate_zones",
+        description="Calculate heart rate training zones for cardio workouts",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "age": {"type": "integer", "description": "Age in years"}
+            },
+            "required": ["age"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_hydration",
-            "description": "Calculate daily water intake recommendations based on weight and activity",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "weight_kg": {"type": "number", "description": "Body weight in kg"},
-                    "activity_level": {
-                        "type": "string",
-                        "enum": ["sedentary", "moderate", "active"],
-                        "description": "Activity level"
-                    }
-                },
-                "required": ["weight_kg"]
-            }
+    ),
+    ToolDef(
+        name="calculate_hydration",
+        description="Calculate daily water intake recommendations based on weight and activity",
+        module="tools.fitness_calc",
+        parameters={
+            "type": "object",
+            "properties": {
+                "weight_kg": {"type": "number", "description": "Body weight in kg"},
+                "activity_level": {
+                    "type": "string",
+                    "enum": ["sedentary", "moderate", "active"],
+                    "description": "Activity level"
+                }
+            },
+            "required": ["weight_kg"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "generate_workout",
-            "description": "Generate a personalized workout plan based on goals, experience level, and available equipment",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "goal": {
-                        "type": "string",
-                        "enum": ["muscle_gain", "strength", "fat_loss", "endurance", "general_fitness"],
-                        "description": "Primary fitness goal"
-                    },
-                    "level": {
-                        "type": "string",
-                        "enum": ["beginner", "intermediate", "advanced"],
-                        "description": "Experience level"
-                    },
-                    "days_per_week": {
-                        "type": "integer",
-                        "description": "Number of workout days per week (3-6)",
-                        "minimum": 3,
-                        "maximum": 6
-                    },
-                    "equipment": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Available equipment (e.g., dumbbells, barbell, bodyweight, cables, machine)"
-                    },
-                    "duration_minutes": {
-                        "type": "integer",
-                        "description": "Target workout duration in minutes"
-                    }
+    ),
+    ToolDef(
+        name="generate_workout",
+        description="Generate a personalized workout plan based on goals, experience level, and available equipment",
+        module="tools.workout_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "goal": {
+                    "type": "string",
+                    "enum": ["muscle_gain", "strength", "fat_loss", "endurance", "general_fitness"],
+                    "description": "Primary fitness goal"
                 },
-                "required": ["goal", "level", "days_per_week", "equipment"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_exercise_recommendations",
-            "description": "Get exercise recommendations for specific muscle groups with equipment and experience level",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "muscle_group": {
-                        "type": "string",
-                        "enum": ["chest", "back", "legs", "shoulders", "arms", "core"],
-                        "description": "Target muscle group"
-                    },
-                    "equipment": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Available equipment"
-                    },
-                    "level": {
-                        "type": "string",
-                        "enum": ["beginner", "intermediate", "advanced"],
-                        "description": "Experience level"
-                    }
+                "level": {
+                    "type": "string",
+                    "enum": ["beginner", "intermediate", "advanced"],
+                    "description": "Experience level"
                 },
-                "required": ["muscle_group", "equipment", "level"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "calculate_progressive_overload",
-            "description": "Calculate how to progress in strength training with progressive overload",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "current_weight": {"type": "number", "description": "Current working weight"},
-                    "current_reps": {"type": "integer", "description": "Current reps performed"},
-                    "target_reps": {"type": "integer", "description": "Target rep range (upper limit)"},
-                    "progression_type": {
-                        "type": "string",
-                        "enum": ["weight", "reps", "both"],
-                        "description": "Type of progression"
-                    }
+                "days_per_week": {
+                    "type": "integer",
+                    "description": "Number of workout days per week (3-6)",
+                    "minimum": 3,
+                    "maximum": 6
                 },
-                "required": ["current_weight", "current_reps", "target_reps"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "generate_meal_plan",
-            "description": "Generate a daily meal plan based on macronutrient targets and dietary preferences",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "calories": {"type": "number", "description": "Daily calorie target"},
-                    "protein_g": {"type": "number", "description": "Daily protein target in grams"},
-                    "carbs_g": {"type": "number", "description": "Daily carbs target in grams"},
-                    "fat_g": {"type": "number", "description": "Daily fat target in grams"},
-                    "meals_per_day": {
-                        "type": "integer",
-                        "description": "Number of meals per day (3-6)",
-                        "minimum": 3,
-                        "maximum": 6
-                    },
-                    "dietary_preference": {
-                        "type": "string",
-                        "enum": ["balanced", "high_protein", "low_carb", "vegetarian"],
-                        "description": "Dietary preference"
-                    }
+                "equipment": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Available equipment (e.g., dumbbells, barbell, bodyweight, cables, machine)"
                 },
-                "required": ["calories", "protein_g", "carbs_g", "fat_g"]
-            }
+                "duration_minutes": {
+                    "type": "integer",
+                    "description": "Target workout duration in minutes"
+                }
+            },
+            "required": ["goal", "level", "days_per_week", "equipment"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_nutrition_info",
-            "description": "Get detailed nutrition information for common foods",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "food_item": {"type": "string", "description": "Name of the food item"}
+    ),
+    ToolDef(
+        name="get_exercise_recommendations",
+        description="Get exercise recommendations for specific muscle groups with equipment and experience level",
+        module="tools.workout_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "muscle_group": {
+                    "type": "string",
+                    "enum": ["chest", "back", "legs", "shoulders", "arms", "core"],
+                    "description": "Target muscle group"
                 },
-                "required": ["food_item"]
-            }
+                "equipment": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Available equipment"
+                },
+                "level": {
+                    "type": "string",
+                    "enum": ["beginner", "intermediate", "advanced"],
+                    "description": "Experience level"
+                }
+            },
+            "required": ["muscle_group", "equipment", "level"]
+        }
+    ),
+    ToolDef(
+        name="calculate_progressive_overload",
+        description="Calculate how to progress in strength training with progressive overload",
+        module="tools.workout_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "current_weight": {"type": "number", "description": "Current working weight"},
+                "current_reps": {"type": "integer", "description": "Current reps performed"},
+                "target_reps": {"type": "integer", "description": "Target rep range (upper limit)"},
+                "progression_type": {
+                    "type": "string",
+                    "enum": ["weight", "reps", "both"],
+                    "description": "Type of progression"
+                }
+            },
+            "required": ["current_weight", "current_reps", "target_reps"]
         }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_healthy_alternatives",
-            "description": "Get healthier alternatives to common foods with explanations",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "food_item": {"type": "string", "description": "Food to find alternatives for"}
+    ),
+    ToolDef(
+        name="generate_meal_plan",
+        description="Generate a daily meal plan based on macronutrient targets and dietary preferences",
+        module="tools.nutrition_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "calories": {"type": "number", "description": "Daily calorie target"},
+                "protein_g": {"type": "number", "description": "Daily protein target in grams"},
+                "carbs_g": {"type": "number", "description": "Daily carbs target in grams"},
+                "fat_g": {"type": "number", "description": "Daily fat target in grams"},
+                "meals_per_day": {
+                    "type": "integer",
+                    "description": "Number of meals per day (3-6)",
+                    "minimum": 3,
+                    "maximum": 6
                 },
-                "required": ["food_item"]
+                "dietary_preference": {
+                    "type": "string",
+                    "enum": ["balanced", "high_protein", "low_carb", "vegetarian"],
+                    "description": "Dietary preference"
+                }
+            },
+            "required": ["calories", "protein_g", "carbs_g", "fat_g"]
+        }
+    ),
+    ToolDef(
+        name="get_nutrition_info",
+        description="Get detailed nutrition information for common foods",
+        module="tools.nutrition_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "food_item": {"type": "string", "description": "Name of the food item"}
+            },
+            "required": ["food_item"]
+        }
+    ),
+    ToolDef(
+        name="get_healthy_alternatives",
+        description="Get healthier alternatives to common foods with explanations",
+        module="tools.nutrition_tools",
+        parameters={
+            "type": "object",
+            "properties": {
+                "food_item": {"type": "string", "description": "Food to find alternatives for"}
+            },
+            "required": ["food_item"]
+        }
+    )
+)
+
+
+def _build_tools() -> Tuple[Dict[str, Any], ...]:
+    """Build the OpenAI tool definitions from _TOOL_DEFS."""
+    return tuple(
+        {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters
             }
         }
-    }
-]
+        for tool in _TOOL_DEFS
+    )
+
+
+def _get_tools() -> Tuple[Dict[str, Any], ...]:
+    """Build TOOLS on first use and memoize it as a module global."""
+    tools = globals().get("TOOLS")
+    if tools is None:
+        tools = globals()["TOOLS"] = _build_tools()
+    return tools
+
+
+# Argument validators, compiled from each tool's parameter schema on first use
+_VALIDATORS: Dict[str, Validator] = {}
 
 
-# Function mapping
-FUNCTION_MAP: Dict[str, Callable] = {
-    "calculate_bmi": calculate_bmi,
-    "calculate_tdee": calculate_tdee,
-    "calculate_macros": calculate_macros,
-    "calculate_one_rep_max": calculate_one_rep_max,
-    "calculate_body_fat_navy": calculate_body_fat_navy,
-    "calculate_heart_rate_zones": calculate_heart_rate_zones,
-    "calculate_hydration": calculate_hydration,
-    "generate_workout": generate_workout,
-    "get_exercise_recommendations": get_exercise_recommendations,
-    "calculate_progressive_overload": calculate_progressive_overload,
-    "generate_meal_plan": generate_meal_plan,
-    "get_nutrition_info": get_nutrition_info,
-    "get_healthy_alternatives": get_healthy_alternatives
+def _compile_validators() -> Dict[str, Validator]:
+    """Fill _VALIDATORS from _TOOL_DEFS and return it."""
+    if not _VALIDATORS:
+        _VALIDATORS.update({tool.name: compile_schema(tool.parameters) for tool in _TOOL_DEFS})
+    return _VALIDATORS
+
+
+# Function mapping: name -> (module, attribute) until first use, after which
+# the entry is replaced with the resolved callable
+FUNCTION_MAP: Dict[str, Union[Callable, Tuple[str, str]]] = {
+    tool.name: (tool.module, tool.name) for tool in _TOOL_DEFS
 }
 
 
-def execute_function(function_name: str, arguments: Dict[str, Any]) -> Any:
+def _resolve_function(function_name: str) -> Optional[Callable]:
+    """Look up a tool's implementation, importing its module on first use."""
+    entry = FUNCTION_MAP.get(function_name)
+    if isinstance(entry, tuple):
+        module_name, attribute = entry
+        entry = getattr(importlib.import_module(module_name), attribute)
+        FUNCTION_MAP[function_name] = entry
+    return entry
+
+
+def __getattr__(name: str) -> Any:
+    """Build TOOLS and resolve tool functions on first attribute access (PEP 562)."""
+    if name == "TOOLS":
+        return _get_tools()
+    if name in FUNCTION_MAP:
+        return _resolve_function(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def execute_function(
+    function_name: str,
+    arguments: Dict[str, Any],
+    _dispatch: Dict[str, Union[Callable, Tuple[str, str]]] = FUNCTION_MAP,
+    _validators: Dict[str, Validator] = _VALIDATORS
+) -> Any:
     """
     Execute a function by name with given arguments.
 
+    Arguments are validated against the tool's parameter schema first, so
+    malformed calls from the model are rejected with a clear message before
+    reaching the tool.
+
     Args:
         function_name: Name of the function to execute
         arguments: Dictionary of arguments to pass to the function
@@ -332,11 +382,54 @@ def execute_function(function_name: str, arguments: Dict[str, Any]) -> Any:
     Returns:
         Result from the function execution
     """
-    func = FUNCTION_MAP.get(function_name)
-    if func:
-        try:
-            return func(**arguments)
-        except Exception as e:
-            return {"error": f"Function execution failed: {str(e)}"}
-    else:
+    # The tables are bound as default arguments so lookups are locals, and
+    # resolved tools are called straight from FUNCTION_MAP
+    func = _dispatch.get(function_name)
+    if func is None:
         return {"error": f"Function '{function_name}' not found"}
+
+    try:
+        (_validators.get(function_name) or _compile_validators()[function_name])(arguments)
+    except SchemaValidationError as e:
+        return {"error": f"Invalid arguments: {e}"}
+
+    try:
+        # A tool's module is imported on its first call, so a failing
+        # import is reported like any other error from the tool
+        if isinstance(func, tuple):
+            func = _resolve_function(function_name)
+        return func(**arguments)
+    except Exception as e:
+        return {"error": f"Function execution failed: {str(e)}"}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the read-only mappings some tools return."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=256)
+def _execute_function_json(function_name: str, canonical_arguments: str) -> str:
+    """Execute a function from canonical JSON arguments and serialize its result."""
+    result = execute_function(function_name, json.loads(canonical_arguments))
+    return json.dumps(result, default=_json_default)
+
+
+def execute_function_json(function_name: str, arguments: Dict[str, Any]) -> str:
+    """
+    Execute a function by name and return its result serialized as JSON.
+
+    Every tool is a pure function of its arguments, so results are memoized on
+    (function name, arguments dumped with sorted keys); repeated calls skip both
+    the computation and the serialization.
+
+    Args:
+        function_name: Name of the function to execute
+        arguments: Dictionary of arguments to pass to the function
+
+    Returns:
+        JSON string of the function's result
+    """
+    return _execute_function_json(function_name, json.dumps(arguments, sort_keys=True))
@@ -1,9 +1,226 @@
 """
 Workout generation and exercise tools.
 """
-import json
-import random
-from typing import Dict, List, Any
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
+
+
+# Closed vocabularies from the tool schemas. Members are str instances that
+# hash and compare like their values, so tables keyed by them are looked up
+# directly with the plain strings in tool arguments.
+class Goal(str, Enum):
+    MUSCLE_GAIN = "muscle_gain"
+    STRENGTH = "strength"
+    FAT_LOSS = "fat_loss"
+    ENDURANCE = "endurance"
+    GENERAL_FITNESS = "general_fitness"
+
+
+class Level(str, Enum):
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+
+
+class MuscleGroup(str, Enum):
+    CHEST = "chest"
+    BACK = "back"
+    LEGS = "legs"
+    SHOULDERS = "shoulders"
+    ARMS = "arms"
+    CORE = "core"
+
+
+class Equipment(str, Enum):
+    BODYWEIGHT = "bodyweight"
+    DUMBBELLS = "dumbbells"
+    BARBELL = "barbell"
+    CABLES = "cables"
+    MACHINE = "machine"
+    AB_WHEEL = "ab_wheel"
+
+
+class ProgressionType(str, Enum):
+    WEIGHT = "weight"
+    REPS = "reps"
+    BOTH = "both"
+
+
+# Workout split for each number of training days: (split name, routine)
+_SPLITS = {
+    3: ("Full Body (3x/week)", ("Full Body A", "Full Body B", "Full Body C")),
+    4: ("Upper/Lower Split", ("Upper Body A", "Lower Body A", "Upper Body B", "Lower Body B")),
+    5: ("Push/Pull/Legs", ("Push Day", "Pull Day", "Legs", "Push Day", "Pull Day")),
+    6: ("Push/Pull/Legs (2x/week)", ("Push", "Pull", "Legs", "Push", "Pull", "Legs"))
+}
+_DEFAULT_SPLIT = _SPLITS[6]
+
+# Sets/reps guideline and rest period for each goal
+_GOAL_PROTOCOL = {
+    Goal.STRENGTH: ("4-5 sets of 3-6 reps", "3-5 minutes"),
+    Goal.MUSCLE_GAIN: ("3-4 sets of 8-12 reps", "60-90 seconds"),
+    Goal.ENDURANCE: ("2-3 sets of 15-20 reps", "30-45 seconds"),
+    Goal.FAT_LOSS: ("3 sets of 12-15 reps", "45-60 seconds"),
+    Goal.GENERAL_FITNESS: ("3 sets of 10-12 reps", "60 seconds")
+}
+_DEFAULT_GOAL = Goal.GENERAL_FITNESS
+
+# Invariant parts of every workout plan
+_WARM_UP = "5-10 minutes of light cardio and dynamic stretching"
+_COOL_DOWN = "5 minutes of stretching"
+_STATIC_TIPS = (
+    "Progressive overload: Gradually increase weight or reps each week",
+    "Maintain proper form over heavy weight",
+    "Stay hydrated throughout your workout",
+    "Track your progress in a workout journal"
+)
+
+# Progressive overload: 2.5% weight increase (conservative), one
+# recommendation template per strategy, and notes shared by every result
+_OVERLOAD_STEP = 1.025
+_HOLD = "hold"
+_OVERLOAD_RECOMMENDATIONS = {
+    ProgressionType.WEIGHT: "Increase weight to {new_weight} and drop reps to lower range",
+    _HOLD: "Keep current weight {current_weight}, aim for {target_reps} reps",
+    ProgressionType.REPS: "Keep weight at {current_weight}, add 1-2 reps per session",
+    ProgressionType.BOTH: "Increase weight to {new_weight} OR add 1-2 reps"
+}
+_OVERLOAD_NOTES = (
+    "Only progress when you can complete all sets with good form",
+    "Small increases are better than large jumps",
+    "Aim to progress every 1-2 weeks",
+    "Deload every 4-6 weeks to prevent overtraining"
+)
+
+
+def _records(*exercises: Dict[str, str]) -> Tuple[Mapping[str, str], ...]:
+    """Freeze exercise records, which are shared between calls."""
+    return tuple(MappingProxyType(exercise) for exercise in exercises)
+
+
+# Exercise database keyed by (muscle group, level), with read-only records
+_EXERCISE_DB = {
+    (MuscleGroup.CHEST, Level.BEGINNER): _records(
+        {"name": "Push-ups", "equipment": "bodyweight", "sets": "3", "reps": "8-12"},
+        {"name": "Incline Push-ups", "equipment": "bodyweight", "sets": "3", "reps": "10-15"},
+        {"name": "Dumbbell Bench Press", "equipment": "dumbbells", "sets": "3", "reps": "8-12"},
+        {"name": "Dumbbell Flyes", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
+    ),
+    (MuscleGroup.CHEST, Level.INTERMEDIATE): _records(
+        {"name": "Barbell Bench Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Incline Dumbbell Press", "equipment": "dumbbells", "sets": "3", "reps": "8-12"},
+        {"name": "Cable Flyes", "equipment": "cables", "sets": "3", "reps": "12-15"},
+        {"name": "Dips", "equipment": "bodyweight", "sets": "3", "reps": "8-12"}
+    ),
+    (MuscleGroup.CHEST, Level.ADVANCED): _records(
+        {"name": "Barbell Bench Press", "equipment": "barbell", "sets": "5", "reps": "5-8"},
+        {"name": "Incline Barbell Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Weighted Dips", "equipment": "bodyweight", "sets": "4", "reps": "6-10"},
+        {"name": "Cable Crossovers", "equipment": "cables", "sets": "3", "reps": "12-15"}
+    ),
+    (MuscleGroup.BACK, Level.BEGINNER): _records(
+        {"name": "Dumbbell Rows", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Lat Pulldowns", "equipment": "cables", "sets": "3", "reps": "10-12"},
+        {"name": "Seated Cable Rows", "equipment": "cables", "sets": "3", "reps": "10-12"},
+        {"name": "Back Extensions", "equipment": "bodyweight", "sets": "3", "reps": "12-15"}
+    ),
+    (MuscleGroup.BACK, Level.INTERMEDIATE): _records(
+        {"name": "Pull-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-10"},
+        {"name": "Barbell Rows", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "T-Bar Rows", "equipment": "barbell", "sets": "3", "reps": "10-12"},
+        {"name": "Face Pulls", "equipment": "cables", "sets": "3", "reps": "15-20"}
+    ),
+    (MuscleGroup.BACK, Level.ADVANCED): _records(
+        {"name": "Weighted Pull-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-8"},
+        {"name": "Deadlifts", "equipment": "barbell", "sets": "4", "reps": "5-8"},
+        {"name": "Pendlay Rows", "equipment": "barbell", "sets": "4", "reps": "6-8"},
+        {"name": "Chest Supported Rows", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
+    ),
+    (MuscleGroup.LEGS, Level.BEGINNER): _records(
+        {"name": "Bodyweight Squats", "equipment": "bodyweight", "sets": "3", "reps": "12-15"},
+        {"name": "Lunges", "equipment": "bodyweight", "sets": "3", "reps": "10-12 each leg"},
+        {"name": "Leg Press", "equipment": "machine", "sets": "3", "reps": "12-15"},
+        {"name": "Leg Curls", "equipment": "machine", "sets": "3", "reps": "12-15"}
+    ),
+    (MuscleGroup.LEGS, Level.INTERMEDIATE): _records(
+        {"name": "Barbell Squats", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Romanian Deadlifts", "equipment": "barbell", "sets": "3", "reps": "10-12"},
+        {"name": "Bulgarian Split Squats", "equipment": "dumbbells", "sets": "3", "reps": "10-12 each"},
+        {"name": "Leg Extensions", "equipment": "machine", "sets": "3", "reps": "12-15"}
+    ),
+    (MuscleGroup.LEGS, Level.ADVANCED): _records(
+        {"name": "Back Squats", "equipment": "barbell", "sets": "5", "reps": "5-8"},
+        {"name": "Front Squats", "equipment": "barbell", "sets": "4", "reps": "6-8"},
+        {"name": "Deadlifts", "equipment": "barbell", "sets": "4", "reps": "5-8"},
+        {"name": "Walking Lunges", "equipment": "dumbbells", "sets": "4", "reps": "12 each leg"}
+    ),
+    (MuscleGroup.SHOULDERS, Level.BEGINNER): _records(
+        {"name": "Dumbbell Shoulder Press", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Lateral Raises", "equipment": "dumbbells", "sets": "3", "reps": "12-15"},
+        {"name": "Front Raises", "equipment": "dumbbells", "sets": "3", "reps": "12-15"},
+        {"name": "Face Pulls", "equipment": "cables", "sets": "3", "reps": "15-20"}
+    ),
+    (MuscleGroup.SHOULDERS, Level.INTERMEDIATE): _records(
+        {"name": "Overhead Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Arnold Press", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Lateral Raises", "equipment": "dumbbells", "sets": "4", "reps": "12-15"},
+        {"name": "Reverse Flyes", "equipment": "dumbbells", "sets": "3", "reps": "12-15"}
+    ),
+    (MuscleGroup.SHOULDERS, Level.ADVANCED): _records(
+        {"name": "Push Press", "equipment": "barbell", "sets": "4", "reps": "6-8"},
+        {"name": "Seated Dumbbell Press", "equipment": "dumbbells", "sets": "4", "reps": "8-10"},
+        {"name": "Cable Lateral Raises", "equipment": "cables", "sets": "4", "reps": "15-20"},
+        {"name": "Upright Rows", "equipment": "barbell", "sets": "3", "reps": "10-12"}
+    ),
+    (MuscleGroup.ARMS, Level.BEGINNER): _records(
+        {"name": "Dumbbell Bicep Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Tricep Dips", "equipment": "bodyweight", "sets": "3", "reps": "8-12"},
+        {"name": "Hammer Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Tricep Extensions", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
+    ),
+    (MuscleGroup.ARMS, Level.INTERMEDIATE): _records(
+        {"name": "Barbell Curls", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Close-Grip Bench Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
+        {"name": "Preacher Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
+        {"name": "Skull Crushers", "equipment": "barbell", "sets": "3", "reps": "10-12"}
+    ),
+    (MuscleGroup.ARMS, Level.ADVANCED): _records(
+        {"name": "Weighted Chin-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-8"},
+        {"name": "Close-Grip Bench Press", "equipment": "barbell", "sets": "5", "reps": "6-8"},
+        {"name": "Cable Curls", "equipment": "cables", "sets": "4", "reps": "12-15"},
+        {"name": "Overhead Tricep Extension", "equipment": "dumbbells", "sets": "4", "reps": "10-12"}
+    ),
+    (MuscleGroup.CORE, Level.BEGINNER): _records(
+        {"name": "Plank", "equipment": "bodyweight", "sets": "3", "reps": "30-60 seconds"},
+        {"name": "Crunches", "equipment": "bodyweight", "sets": "3", "reps": "15-20"},
+        {"name": "Bicycle Crunches", "equipment": "bodyweight", "sets": "3", "reps": "15-20"},
+        {"name": "Dead Bug", "equipment": "bodyweight", "sets": "3", "reps": "10-12 each side"}
+    ),
+    (MuscleGroup.CORE, Level.INTERMEDIATE): _records(
+        {"name": "Hanging Knee Raises", "equipment": "bodyweight", "sets": "3", "reps": "12-15"},
+        {"name": "Russian Twists", "equipment": "bodyweight", "sets": "3", "reps": "20-30"},
+        {"name": "Mountain Climbers", "equipment": "bodyweight", "sets": "3", "reps": "20-30"},
+        {"name": "Cable Crunches", "equipment": "cables", "sets": "3", "reps": "15-20"}
+    ),
+    (MuscleGroup.CORE, Level.ADVANCED): _records(
+        {"name": "Hanging Leg Raises", "equipment": "bodyweight", "sets": "4", "reps": "12-15"},
+        {"name": "Ab Wheel Rollouts", "equipment": "ab_wheel", "sets": "4", "reps": "10-12"},
+        {"name": "Dragon Flags", "equipment": "bodyweight", "sets": "3", "reps": "6-10"},
+        {"name": "Pallof Press", "equipment": "cables", "sets": "3", "reps": "12-15 each side"}
+    )
+}
+
+# Bodyweight exercises are recommended whatever equipment is available
+_ALWAYS_AVAILABLE = frozenset({Equipment.BODYWEIGHT})
+
+# Lowercased equipment of each record, in the same order as _EXERCISE_DB, so
+# filtering doesn't lowercase every record on every call
+_EXERCISE_EQUIPMENT = {
+    key: tuple(exercise["equipment"].lower() for exercise in exercises)
+    for key, exercises in _EXERCISE_DB.items()
+}
 
 
 def generate_workout(
@@ -12,7 +229,7 @@ def generate_workout(
     days_per_week: int,
     equipment: List[str],
     duration_minutes: int = 60
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Generate a personalized workout plan.
 
@@ -24,40 +241,24 @@ def generate_workout(
         duration_minutes: Target workout duration
 
     Returns:
-        Dictionary with complete workout plan
+        Read-only dictionary with complete workout plan
     """
-    # Define workout splits based on days
-    if days_per_week == 3:
-        split = "Full Body (3x/week)"
-        routine = ["Full Body A", "Full Body B", "Full Body C"]
-    elif days_per_week == 4:
-        split = "Upper/Lower Split"
-        routine = ["Upper Body A", "Lower Body A", "Upper Body B", "Lower Body B"]
-    elif days_per_week == 5:
-        split = "Push/Pull/Legs"
-        routine = ["Push Day", "Pull Day", "Legs", "Push Day", "Pull Day"]
-    else:  # 6 days
-        split = "Push/Pull/Legs (2x/week)"
-        routine = ["Push", "Pull", "Legs", "Push", "Pull", "Legs"]
-
-    # Determine sets and reps based on goal
-    if goal == "strength":
-        sets_reps = "4-5 sets of 3-6 reps"
-        rest = "3-5 minutes"
-    elif goal == "muscle_gain":
-        sets_reps = "3-4 sets of 8-12 reps"
-        rest = "60-90 seconds"
-    elif goal == "endurance":
-        sets_reps = "2-3 sets of 15-20 reps"
-        rest = "30-45 seconds"
-    elif goal == "fat_loss":
-        sets_reps = "3 sets of 12-15 reps"
-        rest = "45-60 seconds"
-    else:  # general_fitness
-        sets_reps = "3 sets of 10-12 reps"
-        rest = "60 seconds"
-
-    return {
+    return _generate_workout(goal, level, days_per_week, tuple(equipment), duration_minutes)
+
+
+@lru_cache(maxsize=256)
+def _generate_workout(
+    goal: str,
+    level: str,
+    days_per_week: int,
+    equipment: Tuple[str, ...],
+    duration_minutes: int
+) -> Mapping[str, Any]:
+    """Build a workout plan; results are shared between callers, so they are read-only."""
+    split, routine = _SPLITS.get(days_per_week, _DEFAULT_SPLIT)
+    sets_reps, rest = _GOAL_PROTOCOL.get(goal, _GOAL_PROTOCOL[_DEFAULT_GOAL])
+
+    return MappingProxyType({
         "split": split,
         "days_per_week": days_per_week,
         "routine": routine,
@@ -67,26 +268,20 @@ def generate_workout(
         "rest_periods": rest,
         "duration_minutes": duration_minutes,
         "equipment": equipment,
-        "workout_structure": {
-            "warm_up": "5-10 minutes of light cardio and dynamic stretching",
+        "workout_structure": MappingProxyType({
+            "warm_up": _WARM_UP,
             "main_workout": f"{duration_minutes - 15} minutes",
-            "cool_down": "5 minutes of stretching"
-        },
-        "tips": [
-            "Progressive overload: Gradually increase weight or reps each week",
-            "Maintain proper form over heavy weight",
-            "Stay hydrated throughout your workout",
-            f"Rest {rest} between sets",
-            "Track your progress in a workout journal"
-        ]
-    }
+            "cool_down": _COOL_DOWN
+        }),
+        "tips": (*_STATIC_TIPS[:3], f"Rest {rest} between sets", _STATIC_TIPS[3])
+    })
 
 
 def get_exercise_recommendations(
     muscle_group: str,
     equipment: List[str],
     level: str = "intermediate"
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Get exercise recommendations for a specific muscle group.
 
@@ -96,148 +291,35 @@ def get_exercise_recommendations(
         level: beginner, intermediate, advanced
 
     Returns:
-        Dictionary with recommended exercises
+        Read-only dictionary with recommended exercises
     """
-    # Comprehensive exercise database
-    exercises = {
-        "chest": {
-            "beginner": [
-                {"name": "Push-ups", "equipment": "bodyweight", "sets": "3", "reps": "8-12"},
-                {"name": "Incline Push-ups", "equipment": "bodyweight", "sets": "3", "reps": "10-15"},
-                {"name": "Dumbbell Bench Press", "equipment": "dumbbells", "sets": "3", "reps": "8-12"},
-                {"name": "Dumbbell Flyes", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
-            ],
-            "intermediate": [
-                {"name": "Barbell Bench Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Incline Dumbbell Press", "equipment": "dumbbells", "sets": "3", "reps": "8-12"},
-                {"name": "Cable Flyes", "equipment": "cables", "sets": "3", "reps": "12-15"},
-                {"name": "Dips", "equipment": "bodyweight", "sets": "3", "reps": "8-12"}
-            ],
-            "advanced": [
-                {"name": "Barbell Bench Press", "equipment": "barbell", "sets": "5", "reps": "5-8"},
-                {"name": "Incline Barbell Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Weighted Dips", "equipment": "bodyweight", "sets": "4", "reps": "6-10"},
-                {"name": "Cable Crossovers", "equipment": "cables", "sets": "3", "reps": "12-15"}
-            ]
-        },
-        "back": {
-            "beginner": [
-                {"name": "Dumbbell Rows", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Lat Pulldowns", "equipment": "cables", "sets": "3", "reps": "10-12"},
-                {"name": "Seated Cable Rows", "equipment": "cables", "sets": "3", "reps": "10-12"},
-                {"name": "Back Extensions", "equipment": "bodyweight", "sets": "3", "reps": "12-15"}
-            ],
-            "intermediate": [
-                {"name": "Pull-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-10"},
-                {"name": "Barbell Rows", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "T-Bar Rows", "equipment": "barbell", "sets": "3", "reps": "10-12"},
-                {"name": "Face Pulls", "equipment": "cables", "sets": "3", "reps": "15-20"}
-            ],
-            "advanced": [
-                {"name": "Weighted Pull-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-8"},
-                {"name": "Deadlifts", "equipment": "barbell", "sets": "4", "reps": "5-8"},
-                {"name": "Pendlay Rows", "equipment": "barbell", "sets": "4", "reps": "6-8"},
-                {"name": "Chest Supported Rows", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
-            ]
-        },
-        "legs": {
-            "beginner": [
-                {"name": "Bodyweight Squats", "equipment": "bodyweight", "sets": "3", "reps": "12-15"},
-                {"name": "Lunges", "equipment": "bodyweight", "sets": "3", "reps": "10-12 each leg"},
-                {"name": "Leg Press", "equipment": "machine", "sets": "3", "reps": "12-15"},
-                {"name": "Leg Curls", "equipment": "machine", "sets": "3", "reps": "12-15"}
-            ],
-            "intermediate": [
-                {"name": "Barbell Squats", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Romanian Deadlifts", "equipment": "barbell", "sets": "3", "reps": "10-12"},
-                {"name": "Bulgarian Split Squats", "equipment": "dumbbells", "sets": "3", "reps": "10-12 each"},
-                {"name": "Leg Extensions", "equipment": "machine", "sets": "3", "reps": "12-15"}
-            ],
-            "advanced": [
-                {"name": "Back Squats", "equipment": "barbell", "sets": "5", "reps": "5-8"},
-                {"name": "Front Squats", "equipment": "barbell", "sets": "4", "reps": "6-8"},
-                {"name": "Deadlifts", "equipment": "barbell", "sets": "4", "reps": "5-8"},
-                {"name": "Walking Lunges", "equipment": "dumbbells", "sets": "4", "reps": "12 each leg"}
-            ]
-        },
-        "shoulders": {
-            "beginner": [
-                {"name": "Dumbbell Shoulder Press", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Lateral Raises", "equipment": "dumbbells", "sets": "3", "reps": "12-15"},
-                {"name": "Front Raises", "equipment": "dumbbells", "sets": "3", "reps": "12-15"},
-                {"name": "Face Pulls", "equipment": "cables", "sets": "3", "reps": "15-20"}
-            ],
-            "intermediate": [
-                {"name": "Overhead Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Arnold Press", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Lateral Raises", "equipment": "dumbbells", "sets": "4", "reps": "12-15"},
-                {"name": "Reverse Flyes", "equipment": "dumbbells", "sets": "3", "reps": "12-15"}
-            ],
-            "advanced": [
-                {"name": "Push Press", "equipment": "barbell", "sets": "4", "reps": "6-8"},
-                {"name": "Seated Dumbbell Press", "equipment": "dumbbells", "sets": "4", "reps": "8-10"},
-                {"name": "Cable Lateral Raises", "equipment": "cables", "sets": "4", "reps": "15-20"},
-                {"name": "Upright Rows", "equipment": "barbell", "sets": "3", "reps": "10-12"}
-            ]
-        },
-        "arms": {
-            "beginner": [
-                {"name": "Dumbbell Bicep Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Tricep Dips", "equipment": "bodyweight", "sets": "3", "reps": "8-12"},
-                {"name": "Hammer Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Tricep Extensions", "equipment": "dumbbells", "sets": "3", "reps": "10-12"}
-            ],
-            "intermediate": [
-                {"name": "Barbell Curls", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Close-Grip Bench Press", "equipment": "barbell", "sets": "4", "reps": "8-10"},
-                {"name": "Preacher Curls", "equipment": "dumbbells", "sets": "3", "reps": "10-12"},
-                {"name": "Skull Crushers", "equipment": "barbell", "sets": "3", "reps": "10-12"}
-            ],
-            "advanced": [
-                {"name": "Weighted Chin-ups", "equipment": "bodyweight", "sets": "4", "reps": "6-8"},
-                {"name": "Close-Grip Bench Press", "equipment": "barbell", "sets": "5", "reps": "6-8"},
-                {"name": "Cable Curls", "equipment": "cables", "sets": "4", "reps": "12-15"},
-                {"name": "Overhead Tricep Extension", "equipment": "dumbbells", "sets": "4", "reps": "10-12"}
-            ]
-        },
-        "core": {
-            "beginner": [
-                {"name": "Plank", "equipment": "bodyweight", "sets": "3", "reps": "30-60 seconds"},
-                {"name": "Crunches", "equipment": "bodyweight", "sets": "3", "reps": "15-20"},
-                {"name": "Bicycle Crunches", "equipment": "bodyweight", "sets": "3", "reps": "15-20"},
-                {"name": "Dead Bug", "equipment": "bodyweight", "sets": "3", "reps": "10-12 each side"}
-            ],
-            "intermediate": [
-                {"name": "Hanging Knee Raises", "equipment": "bodyweight", "sets": "3", "reps": "12-15"},
-                {"name": "Russian Twists", "equipment": "bodyweight", "sets": "3", "reps": "20-30"},
-                {"name": "Mountain Climbers", "equipment": "bodyweight", "sets": "3", "reps": "20-30"},
-                {"name": "Cable Crunches", "equipment": "cables", "sets": "3", "reps": "15-20"}
-            ],
-            "advanced": [
-                {"name": "Hanging Leg Raises", "equipment": "bodyweight", "sets": "4", "reps": "12-15"},
-                {"name": "Ab Wheel Rollouts", "equipment": "ab_wheel", "sets": "4", "reps": "10-12"},
-                {"name": "Dragon Flags", "equipment": "bodyweight", "sets": "3", "reps": "6-10"},
-                {"name": "Pallof Press", "equipment": "cables", "sets": "3", "reps": "12-15 each side"}
-            ]
-        }
-    }
-
-    muscle_exercises = exercises.get(muscle_group.lower(), {}).get(level, [])
+    return _get_exercise_recommendations(muscle_group, tuple(equipment), level)
+
+
+@lru_cache(maxsize=256)
+def _get_exercise_recommendations(
+    muscle_group: str,
+    equipment: Tuple[str, ...],
+    level: str
+) -> Mapping[str, Any]:
+    """Select exercises; results are shared between callers, so they are read-only."""
+    key = (muscle_group.lower(), level)
+    muscle_exercises = _EXERCISE_DB.get(key, ())
 
     # Filter by available equipment if specified
-    if equipment and equipment != ["all"]:
-        available_equipment = [e.lower() for e in equipment] + ["bodyweight"]
-        muscle_exercises = [
-            ex for ex in muscle_exercises
-            if ex["equipment"].lower() in available_equipment
-        ]
-
-    return {
+    if equipment and equipment != ("all",):
+        available_equipment = frozenset(e.lower() for e in equipment) | _ALWAYS_AVAILABLE
+        muscle_exercises = tuple(
+            ex for ex, ex_equipment in zip(muscle_exercises, _EXERCISE_EQUIPMENT.get(key, ()))
+            if ex_equipment in available_equipment
+        )
+
+    return MappingProxyType({
         "muscle_group": muscle_group,
         "level": level,
         "exercises": muscle_exercises,
         "equipment_available": equipment
-    }
+    })
 
 
 def calculate_progressive_overload(
@@ -245,7 +327,7 @@ def calculate_progressive_overload(
     current_reps: int,
     target_reps: int,
     progression_type: str = "weight"
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Calculate progressive overload recommendations.
 
@@ -256,38 +338,37 @@ def calculate_progressive_overload(
         progression_type: weight, reps, or both
 
     Returns:
-        Progression recommendations
+        Read-only progression recommendations
     """
-    if progression_type == "weight":
-        # If hitting upper rep range, increase weight by 2.5-5%
-        if current_reps >= target_reps:
-            new_weight = current_weight * 1.025  # 2.5% increase (conservative)
-            recommendation = f"Increase weight to {round(new_weight, 1)} and drop reps to lower range"
-        else:
-            recommendation = f"Keep current weight {current_weight}, aim for {target_reps} reps"
-            new_weight = current_weight
-    elif progression_type == "reps":
+    if progression_type in (ProgressionType.WEIGHT, ProgressionType.REPS):
+        strategy = progression_type
+    else:
+        strategy = ProgressionType.BOTH
+    # Weight progression only increases once the upper rep range is reached
+    if strategy == ProgressionType.WEIGHT and current_reps < target_reps:
+        strategy = _HOLD
+
+    if strategy in (_HOLD, ProgressionType.REPS):
         new_weight = current_weight
-        recommendation = f"Keep weight at {current_weight}, add 1-2 reps per session"
-    else:  # both
-        new_weight = current_weight * 1.025
-        recommendation = f"Increase weight to {round(new_weight, 1)} OR add 1-2 reps"
+    else:
+        new_weight = round(current_weight * _OVERLOAD_STEP, 1)
+
+    recommendation = _OVERLOAD_RECOMMENDATIONS[strategy].format(
+        new_weight=new_weight,
+        current_weight=current_weight,
+        target_reps=target_reps
+    )
 
-    return {
-        "current": {
+    return MappingProxyType({
+        "current": MappingProxyType({
             "weight": current_weight,
             "reps": current_reps
-        },
-        "recommended": {
+        }),
+        "recommended": MappingProxyType({
             "weight": round(new_weight, 1),
             "target_reps": target_reps
-        },
+        }),
         "progression_strategy": progression_type,
         "recommendation": recommendation,
-        "notes": [
-            "Only progress when you can complete all sets with good form",
-            "Small increases are better than large jumps",
-            "Aim to progress every 1-2 weeks",
-            "Deload every 4-6 weeks to prevent overtraining"
-        ]
-    }
+        "notes": _OVERLOAD_NOTES
+    })
@@ -0,0 +1,104 @@
+"""
+Micro-batching for OpenAI embedding requests.
+
+Concurrent sessions each need an embedding for their message. Instead of one
+API round-trip per message, requests arriving within a short window are sent
+together as a single array input.
+"""
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_SECONDS = 0.02
+
+
+class EmbeddingBatcher:
+    """Collects embedding requests and sends them to the API in batches."""
+
+    def __init__(
+        self,
+        client,
+        model: str,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS
+    ):
+        """
+        Args:
+            client: An AsyncOpenAI client
+            model: The embedding model to use
+            max_batch_size: Maximum number of texts per API request
+            max_wait_seconds: How long the first request in a batch waits for others
+        """
+        self.client = client
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Get the embedding for a text, batched with other concurrent requests.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            The embedding vector
+
+        Raises:
+            Exception: Whatever the embedding API call raised for this batch
+        """
+        # The worker is started lazily because it needs a running event loop
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Group queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Send without blocking collection of the next batch
+            task = asyncio.create_task(self._send(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve each caller's future."""
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=[text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for item in response.data:
+            future = batch[item.index][1]
+            if not future.done():
+                future.set_result(item.embedding)
+
+        # Never leave a caller waiting if the response came back short
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding missing from batch response"))
@@ -0,0 +1,83 @@
+"""
+Exact-match response cache for repeated tool-free prompts.
+"""
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+MAX_CACHE_SIZE = 2048
+
+# LRU store: (model, system_prompt_hash, normalized_message) -> response text
+_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+
+
+@lru_cache(maxsize=16)
+def _hash_prompt(system_prompt: str) -> str:
+    """Hash the system prompt so it can be part of the cache key."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase and collapse whitespace so trivially different prompts share a key."""
+    return " ".join(message.lower().split())
+
+
+def make_cache_key(model: str, system_prompt: str, message: str) -> Tuple[str, str, str]:
+    """
+    Build the cache key for a single-turn prompt.
+
+    Args:
+        model: The OpenAI model used to answer
+        system_prompt: The system prompt sent with the message
+        message: The user's input message
+
+    Returns:
+        Tuple of (model, system prompt hash, normalized message)
+    """
+    return (model, _hash_prompt(system_prompt), normalize_message(message))
+
+
+def get_cached_response(model: str, system_prompt: str, message: str) -> Optional[str]:
+    """
+    Look up a previously cached response.
+
+    Args:
+        model: The OpenAI model used to answer
+        system_prompt: The system prompt sent with the message
+        message: The user's input message
+
+    Returns:
+        The cached response text, or None on a cache miss
+    """
+    key = make_cache_key(model, system_prompt, message)
+    content = _cache.get(key)
+    if content is not None:
+        _cache.move_to_end(key)
+    return content
+
+
+def cache_response(model: str, system_prompt: str, message: str, content: str) -> None:
+    """
+    Store a response, evicting the least recently used entry when full.
+
+    Args:
+        model: The OpenAI model used to answer
+        system_prompt: The system prompt sent with the message
+        message: The user's input message
+        content: The response text to cache
+    """
+    if not content:
+        return
+
+    key = make_cache_key(model, system_prompt, message)
+    _cache[key] = content
+    _cache.move_to_end(key)
+    if len(_cache) > MAX_CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Remove all cached responses."""
+    _cache.clear()
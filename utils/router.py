@@ -0,0 +1,108 @@
+"""
+Request routing: pick the cheapest way to answer a user message.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.prefetch import has_ambiguous_measurements, requested_calculators
+
+
+DIRECT_TOOL = "direct_tool"
+NANO = "nano"
+MINI = "mini"
+
+ROUTE_MODELS = {
+    NANO: "gpt-4.1-nano",
+    MINI: "gpt-4o-mini"
+}
+
+# Short single-turn messages (~50 tokens at ~4 characters per token) go to nano
+NANO_MAX_CHARS = 200
+
+# Only plain calculation requests are answered without the LLM
+DIRECT_TOOL_MAX_WORDS = 25
+
+# Anything the calculators in tools.prefetch don't cover needs the LLM
+_OTHER_TOPICS = re.compile(
+    r"water|hydrat|macro|protein|carb|fat|workout|exercise|train|lift|\brep|\bmax\b"
+    r"|meal|diet|food|eat|nutrition|heart|zone|cardio|alternative|plan|program|why|how",
+    re.IGNORECASE
+)
+
+
+def route(message: str, guesses: List[Tuple[str, Dict[str, Any]]], first_turn: bool) -> str:
+    """
+    Choose how to answer a user message.
+
+    Args:
+        message: The user's input message
+        guesses: Fully specified tool calls parsed from the message (see tools.prefetch)
+        first_turn: Whether this is the first message of the conversation
+
+    Returns:
+        DIRECT_TOOL when every requested calculation can be answered from the parsed
+        numbers alone, NANO for short single-turn messages, otherwise MINI
+    """
+    # Skipping the LLM is only safe when every measurement is stated once
+    if (
+        guesses
+        and not has_ambiguous_measurements(message)
+        and len(message.split()) <= DIRECT_TOOL_MAX_WORDS
+        and not _OTHER_TOPICS.search(message)
+        and sorted(name for name, _ in guesses) == sorted(requested_calculators(message))
+    ):
+        return DIRECT_TOOL
+    if first_turn and len(message) <= NANO_MAX_CHARS:
+        return NANO
+    return MINI
+
+
+def _format_bmi(result: Dict[str, Any]) -> str:
+    return (
+        f"📊 **BMI:** {result['bmi']} ({result['category']} - {result['health_status']})\n\n"
+        f"{result['recommendation']}"
+    )
+
+
+def _format_tdee(result: Dict[str, Any]) -> str:
+    loss = result["weight_loss"]
+    gain = result["weight_gain"]
+    return (
+        f"🔥 **Daily calories** ({result['activity_level']} activity)\n"
+        f"- BMR: {result['bmr']:.0f} kcal\n"
+        f"- Maintenance (TDEE): {result['tdee']:.0f} kcal\n"
+        f"- Weight loss: {loss['mild']:.0f} (mild), {loss['moderate']:.0f} (moderate), "
+        f"{loss['aggressive']:.0f} (aggressive) kcal\n"
+        f"- Weight gain: {gain['lean']:.0f} (lean), {gain['moderate']:.0f} (moderate), "
+        f"{gain['bulk']:.0f} (bulk) kcal"
+    )
+
+
+_FORMATTERS = {
+    "calculate_bmi": _format_bmi,
+    "calculate_tdee": _format_tdee
+}
+
+
+def format_direct_answer(results: List[Tuple[str, Dict[str, Any]]]) -> Optional[str]:
+    """
+    Render tool results as a chat reply without calling the LLM.
+
+    Args:
+        results: List of (function_name, result) pairs
+
+    Returns:
+        The formatted reply, or None if any result can't be templated (e.g. an error)
+    """
+    sections = []
+    for function_name, result in results:
+        formatter = _FORMATTERS.get(function_name)
+        if formatter is None or "error" in result:
+            return None
+        sections.append(formatter(result))
+
+    sections.append(
+        "_These are estimates. Tell me your goals and I can build a plan around them, "
+        "and check with a healthcare professional before making big changes._"
+    )
+    return "\n\n".join(sections)
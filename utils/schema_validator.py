@@ -0,0 +1,125 @@
+"""
+Compiled validation of tool-call arguments against their JSON Schema.
+
+Each schema is turned into the source of one flat Python function, which is
+compiled once, so validating a call never re-reads the schema and runs no
+per-keyword function calls. Only the keywords the tool definitions use are
+supported: type, enum, required, properties, items, minimum and maximum.
+Other keywords (description, ...) are ignored.
+"""
+from typing import Any, Callable, Dict, List
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a value doesn't match its schema."""
+
+
+Validator = Callable[[Any], None]
+
+# Inline type tests; {v} is replaced with the variable being checked.
+# JSON has a single number type, so 3.0 counts as an integer.
+_TYPE_TESTS: Dict[str, str] = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, (list, tuple))",
+    "string": "isinstance({v}, str)",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+    "boolean": "isinstance({v}, bool)"
+}
+
+
+def _describe(path: str) -> str:
+    return path or "arguments"
+
+
+class _Generator:
+    """Emits the body of a validation function for one schema."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("_c")
+        self.constants[name] = value
+        return name
+
+    def _fail(self, indent: str, path: str, message: str) -> None:
+        # path is an expression evaluating to the value's path; errors are the
+        # rare case, so the message is assembled only when raised
+        self.lines.append(
+            f"{indent}    raise SchemaValidationError(_describe({path}) + {message!r})"
+        )
+
+    def emit(self, schema: Dict[str, Any], var: str, path: str, indent: str) -> None:
+        """Emit checks of variable var against schema, in keyword order."""
+        # The type check runs first, so the checks after it can rely on the type
+        if "type" in schema:
+            type_name = schema["type"]
+            self.lines.append(f"{indent}if not {_TYPE_TESTS[type_name].format(v=var)}:")
+            self._fail(indent, path, f" must be of type {type_name}")
+
+        if "enum" in schema:
+            allowed = tuple(schema["enum"])
+            self.lines.append(f"{indent}if {var} not in {self._constant(allowed)}:")
+            self._fail(indent, path, f" must be one of {list(allowed)}")
+
+        if "minimum" in schema:
+            minimum = schema["minimum"]
+            self.lines.append(f"{indent}if {var} < {self._constant(minimum)}:")
+            self._fail(indent, path, f" must be >= {minimum}")
+
+        if "maximum" in schema:
+            maximum = schema["maximum"]
+            self.lines.append(f"{indent}if {var} > {self._constant(maximum)}:")
+            self._fail(indent, path, f" must be <= {maximum}")
+
+        for name in schema.get("required", ()):
+            self.lines.append(f"{indent}if {name!r} not in {var}:")
+            self._fail(indent, path, f" is missing required property '{name}'")
+
+        for name, subschema in schema.get("properties", {}).items():
+            child = self._name("v")
+            child_path = f"{path} + {'.' + name!r}" if path != "''" else repr(name)
+            self.lines.append(f"{indent}if {name!r} in {var}:")
+            self.lines.append(f"{indent}    {child} = {var}[{name!r}]")
+            self.emit(subschema, child, child_path, indent + "    ")
+
+        if "items" in schema:
+            index = self._name("i")
+            item = self._name("v")
+            item_path = f"_describe({path}) + '[' + str({index}) + ']'"
+            self.lines.append(f"{indent}for {index}, {item} in enumerate({var}):")
+            self.emit(schema["items"], item, item_path, indent + "    ")
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile a JSON Schema into a validation function.
+
+    Args:
+        schema: The schema, e.g. a tool's "parameters" object
+
+    Returns:
+        Function that takes a value and raises SchemaValidationError if it
+        doesn't match
+    """
+    generator = _Generator()
+    generator.emit(schema, "value", "''", "    ")
+    source = "def validate(value):\n" + "\n".join(generator.lines or ["    pass"]) + "\n"
+
+    namespace = {
+        "SchemaValidationError": SchemaValidationError,
+        "_describe": _describe,
+        **generator.constants
+    }
+    exec(compile(source, "<schema validator>", "exec"), namespace)
+    return namespace["validate"]
@@ -0,0 +1,88 @@
+"""
+Semantic response cache for near-duplicate user prompts.
+
+Responses are stored next to the embedding of the prompt that produced them.
+A new prompt whose embedding is close enough (cosine similarity above the
+threshold) to a stored one is answered with the stored response.
+"""
+from typing import List, Optional
+
+import numpy as np
+
+
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class SemanticCache:
+    """In-process cache of (normalized embedding, response) pairs."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of stored responses (oldest are replaced first)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[str] = []
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: List[float]) -> Optional[str]:
+        """
+        Find the cached response closest to an embedding.
+
+        Args:
+            embedding: Embedding of the user's message
+
+        Returns:
+            The cached response text if the best match exceeds the threshold, else None
+        """
+        if not self._responses:
+            return None
+
+        vector = self._normalize(embedding)
+        scores = self._vectors[:len(self._responses)] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return self._responses[best]
+        return None
+
+    def add(self, embedding: List[float], content: str) -> None:
+        """
+        Store a response for the prompt with the given embedding.
+
+        Args:
+            embedding: Embedding of the user's message
+            content: The response text to cache
+        """
+        if not content:
+            return
+
+        vector = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next_slot
+        self._vectors[slot] = vector
+        if slot < len(self._responses):
+            self._responses[slot] = content
+        else:
+            self._responses.append(content)
+        self._next_slot = (slot + 1) % self.max_entries
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._vectors = None
+        self._responses = []
+        self._next_slot = 0